@@ -1,4 +1,4 @@
-import { mkdtempSync, mkdirSync, writeFileSync, rmSync, realpathSync } from 'fs'
+import { mkdtempSync, mkdirSync, writeFileSync, readFileSync, rmSync, realpathSync, utimesSync } from 'fs'
 import { tmpdir } from 'os'
 import { join } from 'path'
 import { afterEach, describe, expect, test } from 'vitest'
@@ -96,6 +96,19 @@ describe('loadBrandFoundation', () => {
     ])
   })
 
+  test('reuses the parsed foundation until brand.yml changes', () => {
+    const root = createWorkspace()
+    const brandPath = join(root, 'brands', 'givecare', 'brand.yml')
+
+    const first = loadBrandFoundation('givecare', { root })
+    expect(loadBrandFoundation('givecare', { root })).toBe(first)
+
+    writeFileSync(brandPath, readFileSync(brandPath, 'utf8').replace('name: GiveCare', 'name: GiveCare Labs'), 'utf8')
+    utimesSync(brandPath, new Date(), new Date(Date.now() + 5000))
+
+    expect(loadBrandFoundation('givecare', { root }).name).toBe('GiveCare Labs')
+  })
+
   test('rejects unsupported handle keys', () => {
     const root = createWorkspace()
     writeFileSync(
@@ -1,4 +1,4 @@
-import { existsSync, readFileSync } from 'fs'
+import { readFileSync, statSync, type Stats } from 'fs'
 import yaml from 'js-yaml'
 import { join } from 'path'
 import { resolveRuntimePaths } from '../core/paths'
@@ -33,14 +33,34 @@ function optionalString(value: unknown): string | undefined {
   return typeof value === 'string' && value.trim().length > 0 ? value.trim() : undefined
 }
 
+// Parsed foundations keyed by file path. Entries are reused only while the
+// file's mtime and size are unchanged, so edits are picked up on the next load.
+const foundationCache = new Map<string, { mtimeMs: number; size: number; foundation: BrandFoundation }>()
+
 export function loadBrandFoundation(id: string, options: LoadBrandOptions = {}): BrandFoundation {
   const paths = resolveRuntimePaths(options.root)
   const brandPath = join(paths.brandsDir, id, 'brand.yml')
 
-  if (!existsSync(brandPath)) {
+  // A single stat both proves the file exists and keys the cache.
+  let stats: Stats
+  try {
+    stats = statSync(brandPath)
+  } catch {
     throw new Error(`Brand foundation not found: ${brandPath}`)
   }
 
+  const { mtimeMs, size } = stats
+  const cached = foundationCache.get(brandPath)
+  if (cached && cached.mtimeMs === mtimeMs && cached.size === size) {
+    return cached.foundation
+  }
+
+  const foundation = parseBrandFoundation(readFileSync(brandPath, 'utf8'))
+  foundationCache.set(brandPath, { mtimeMs, size, foundation })
+  return foundation
+}
+
+function parseBrandFoundation(source: string): BrandFoundation {
   function loadChannel(raw: unknown, label: string) {
     const ch = expectRecord(raw, label)
     return {
@@ -50,7 +70,7 @@ export function loadBrandFoundation(id: string, options: LoadBrandOptions = {}):
     }
   }
 
-  const raw = yaml.load(readFileSync(brandPath, 'utf8'))
+  const raw = yaml.load(source)
   const data = expectRecord(raw, 'brand')
   const voice = expectRecord(data.voice, 'voice')
   const channels = expectRecord(data.channels, 'channels')
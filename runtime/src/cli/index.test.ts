@@ -4,6 +4,7 @@ import { join } from 'path'
 import { afterEach, describe, expect, test, vi } from 'vitest'
 import { runCli } from './index'
 import { createRuntime } from '../runtime/runtime'
+import { closeRuntimeDbs } from '../runtime/db'
 
 const roots: string[] = []
 const IMAGE_API_KEYS = ['GEMINI_API_KEY', 'GOOGLE_API_KEY'] as const
@@ -88,6 +89,7 @@ async function captureStdout<T>(fn: () => Promise<T>): Promise<{ result: T; stdo
 }
 
 afterEach(() => {
+  closeRuntimeDbs()
   while (roots.length > 0) {
     rmSync(roots.pop()!, { recursive: true, force: true })
   }
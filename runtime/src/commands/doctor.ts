@@ -7,6 +7,8 @@ export async function runDoctorCommand(args: string[], root?: string): Promise<u
   const json = args.includes('--json') // caller already strips --json; kept for standalone use
   const paths = resolveRuntimePaths(root)
   const runtime = createRuntime({ root })
+  // The health probe's result is reused for the report instead of querying twice.
+  let health: Record<string, unknown> | undefined
 
   const checks: DoctorCheck[] = [
     {
@@ -32,7 +34,7 @@ export async function runDoctorCommand(args: string[], root?: string): Promise<u
     {
       name: 'runtime health probe',
       check: () => {
-        const health = runtime.health() as Record<string, unknown>
+        health = runtime.health()
         return typeof health.totalRuns === 'number'
       },
       hint: 'runtime.health() failed',
@@ -42,7 +44,7 @@ export async function runDoctorCommand(args: string[], root?: string): Promise<u
   // doctorRunner writes PASS/FAIL lines to stderr so the JSON envelope stays clean on stdout.
   // exitOnFail:false lets the CLI layer turn failures into its own error envelope.
   const failures = await doctorRunner(checks, { exitOnFail: false })
-  const health = runtime.health()
+  health ??= runtime.health()
 
   const data = {
     ok: failures === 0,
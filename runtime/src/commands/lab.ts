@@ -6,14 +6,25 @@ import { buildCardLabHtml, CARD_LAB_TYPES, type CardLabType } from '../lab/build
 import { renderCardToFile, FIGURES, GRAVITIES, GROUNDS, IMAGE_SUBJECTS, PLATFORMS, type Figure, type Gravity } from '../render/card'
 import { emitPath } from '../lib/agent-cli'
 
+const LAB_PLATFORMS = ['twitter', 'linkedin', 'instagram'] as const
+const LAB_SERIES = ['weekly-insights', 'weekly-recap', 'signal-drop', 'custom'] as const
+
+// Allowlists built once at load so each validation is a single lookup.
+const CARD_LAB_TYPE_SET = new Set<string>(CARD_LAB_TYPES)
+const LAB_PLATFORM_SET = new Set<string>(LAB_PLATFORMS)
+const LAB_SERIES_SET = new Set<string>(LAB_SERIES)
+const FIGURE_SET = new Set<string>(FIGURES)
+const GRAVITY_SET = new Set<string>(GRAVITIES)
+const GROUND_IDS = new Set(GROUNDS.map(g => g.id))
+
 interface LabInput {
   brand?: string
   type: CardLabType
   headline?: string
   body?: string
   eyebrow?: string
-  series: 'weekly-insights' | 'weekly-recap' | 'signal-drop' | 'custom'
-  platform: 'twitter' | 'linkedin' | 'instagram'
+  series: typeof LAB_SERIES[number]
+  platform: typeof LAB_PLATFORMS[number]
   seed?: string
   out?: string
 }
@@ -55,7 +66,7 @@ function usage(): string {
 }
 
 function isCardLabType(value: string): value is CardLabType {
-  return CARD_LAB_TYPES.includes(value as CardLabType)
+  return CARD_LAB_TYPE_SET.has(value)
 }
 
 function normalizeInput(args: string[]): LabInput {
@@ -68,12 +79,12 @@ function normalizeInput(args: string[]): LabInput {
     throw new Error(`Invalid card type: ${type}. Expected one of: ${CARD_LAB_TYPES.join(', ')}`)
   }
 
-  if (!['twitter', 'linkedin', 'instagram'].includes(platform)) {
-    throw new Error('Invalid platform: ' + platform + '. Expected one of: twitter, linkedin, instagram')
+  if (!LAB_PLATFORM_SET.has(platform)) {
+    throw new Error('Invalid platform: ' + platform + '. Expected one of: ' + LAB_PLATFORMS.join(', '))
   }
 
-  if (!['weekly-insights', 'weekly-recap', 'signal-drop', 'custom'].includes(series)) {
-    throw new Error('Invalid series: ' + series + '. Expected one of: weekly-insights, weekly-recap, signal-drop, custom')
+  if (!LAB_SERIES_SET.has(series)) {
+    throw new Error('Invalid series: ' + series + '. Expected one of: ' + LAB_SERIES.join(', '))
   }
 
   return {
@@ -148,9 +159,9 @@ async function runLabRender(args: string[], root?: string): Promise<unknown> {
   const platform = parsed.platform || 'linkedin'
   const image = parsed.image || 'topography'
 
-  if (!FIGURES.includes(figure)) throw new Error('Invalid figure: ' + figure + '. Options: ' + FIGURES.join(', '))
-  if (!GRAVITIES.includes(gravity)) throw new Error('Invalid gravity: ' + gravity + '. Options: ' + GRAVITIES.join(', '))
-  if (!GROUNDS.find(g => g.id === groundId)) throw new Error('Invalid ground: ' + groundId + '. Options: ' + GROUNDS.map(g => g.id).join(', '))
+  if (!FIGURE_SET.has(figure)) throw new Error('Invalid figure: ' + figure + '. Options: ' + FIGURES.join(', '))
+  if (!GRAVITY_SET.has(gravity)) throw new Error('Invalid gravity: ' + gravity + '. Options: ' + GRAVITIES.join(', '))
+  if (!GROUND_IDS.has(groundId)) throw new Error('Invalid ground: ' + groundId + '. Options: ' + GROUNDS.map(g => g.id).join(', '))
   if (!PLATFORMS[platform]) throw new Error('Invalid platform: ' + platform + '. Options: ' + Object.keys(PLATFORMS).join(', '))
 
   const paths = resolveRuntimePaths(root)
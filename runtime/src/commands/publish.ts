@@ -23,7 +23,8 @@ function parsePublishArgs(args: string[]): { runId?: string; dryRun?: boolean; p
       if (invalid.length > 0) {
         throw new Error(`Invalid platform(s): ${invalid.join(', ')}. Expected one of: twitter, linkedin, facebook, instagram, threads`)
       }
-      platforms = requested as SocialPlatform[]
+      // Repeated names would otherwise publish the same post twice.
+      platforms = [...new Set(requested)] as SocialPlatform[]
       index += 1
     }
   }
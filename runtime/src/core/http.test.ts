@@ -0,0 +1,137 @@
+import { afterEach, describe, expect, test, vi } from 'vitest'
+import { fetchJson, fetchOk, retryDelayMs, validateUrl } from './http'
+
+function jsonResponse(status: number, body: unknown, headers: Record<string, string> = {}): Response {
+  return new Response(JSON.stringify(body), { status, headers })
+}
+
+afterEach(() => {
+  vi.useRealTimers()
+  vi.unstubAllGlobals()
+})
+
+describe('validateUrl', () => {
+  test('blocks internal hosts', () => {
+    for (const url of ['http://localhost/x', 'https://cdn.internal/x', 'http://printer.local/x', 'http://[::1]/x', 'http://10.0.0.5/x']) {
+      expect(() => validateUrl(url)).toThrow('Blocked internal URL')
+    }
+  })
+
+  test('allows public hosts', () => {
+    expect(validateUrl('https://images.example.com/a.png').hostname).toBe('images.example.com')
+  })
+})
+
+describe('retryDelayMs', () => {
+  test('prefers Retry-After seconds over backoff', () => {
+    expect(retryDelayMs(new Headers({ 'retry-after': '2' }), 0)).toBe(2000)
+  })
+
+  test('reads epoch-second rate limit resets', () => {
+    expect(retryDelayMs(new Headers({ 'x-rate-limit-reset': '1700000005' }), 0, 1_700_000_000_000)).toBe(5000)
+  })
+
+  test('reads small rate limit resets as seconds from now', () => {
+    expect(retryDelayMs(new Headers({ 'x-ratelimit-reset': '5' }), 0, 1_700_000_000_000)).toBe(5000)
+  })
+
+  test('falls back to exponential backoff', () => {
+    expect(retryDelayMs(new Headers(), 2, 0, () => 0)).toBe(4000)
+  })
+
+  test('adds up to a second of jitter to backoff', () => {
+    expect(retryDelayMs(new Headers(), 1, 0, () => 0.5)).toBe(2500)
+    expect(retryDelayMs(new Headers({ 'retry-after': '1' }), 1, 0, () => 0.5)).toBe(1000)
+  })
+})
+
+describe('fetchJson', () => {
+  test('retries throttled responses and returns the eventual payload', async () => {
+    const fetchMock = vi.fn()
+      .mockResolvedValueOnce(jsonResponse(503, { error: 'busy' }, { 'retry-after': '0' }))
+      .mockResolvedValueOnce(jsonResponse(200, { id: 'post-1' }))
+    vi.stubGlobal('fetch', fetchMock)
+
+    await expect(fetchJson<{ id: string }>('https://example.com/posts', 'Example post failed')).resolves.toEqual({ id: 'post-1' })
+    expect(fetchMock).toHaveBeenCalledTimes(2)
+  })
+
+  test('does not resend a POST after a gateway timeout', async () => {
+    const fetchMock = vi.fn().mockResolvedValue(jsonResponse(504, { error: 'timeout' }, { 'retry-after': '0' }))
+    vi.stubGlobal('fetch', fetchMock)
+
+    await expect(fetchJson('https://example.com/posts', 'Example post failed', { method: 'POST' })).rejects.toThrow('Example post failed: 504')
+    expect(fetchMock).toHaveBeenCalledTimes(1)
+  })
+
+  test('resends a throttled POST', async () => {
+    const fetchMock = vi.fn()
+      .mockResolvedValueOnce(jsonResponse(429, { error: 'limited' }, { 'retry-after': '0' }))
+      .mockResolvedValueOnce(jsonResponse(200, { id: 'post-1' }))
+    vi.stubGlobal('fetch', fetchMock)
+
+    await expect(fetchJson<{ id: string }>('https://example.com/posts', 'Example post failed', { method: 'POST' })).resolves.toEqual({ id: 'post-1' })
+    expect(fetchMock).toHaveBeenCalledTimes(2)
+  })
+
+  test('retries idempotent requests after a network error', async () => {
+    vi.useFakeTimers()
+    const fetchMock = vi.fn()
+      .mockRejectedValueOnce(new TypeError('fetch failed'))
+      .mockResolvedValueOnce(jsonResponse(200, { status: 'FINISHED' }))
+    vi.stubGlobal('fetch', fetchMock)
+
+    const pending = fetchJson<{ status: string }>('https://example.com/status', 'Example status failed')
+    await vi.runAllTimersAsync()
+    await expect(pending).resolves.toEqual({ status: 'FINISHED' })
+    expect(fetchMock).toHaveBeenCalledTimes(2)
+  })
+
+  test('does not resend a POST after a network error', async () => {
+    const fetchMock = vi.fn().mockRejectedValue(new TypeError('fetch failed'))
+    vi.stubGlobal('fetch', fetchMock)
+
+    await expect(fetchJson('https://example.com/posts', 'Example post failed', { method: 'POST' })).rejects.toThrow('fetch failed')
+    expect(fetchMock).toHaveBeenCalledTimes(1)
+  })
+
+  test('does not schedule a retry past the overall timeout', async () => {
+    const fetchMock = vi.fn().mockResolvedValue(jsonResponse(503, { error: 'busy' }, { 'retry-after': '5' }))
+    vi.stubGlobal('fetch', fetchMock)
+
+    await expect(fetchJson('https://example.com/status', 'Example failed', undefined, { timeoutMs: 1_000 })).rejects.toThrow('Example failed: 503')
+    expect(fetchMock).toHaveBeenCalledTimes(1)
+  })
+
+  test('does not retry client errors', async () => {
+    const fetchMock = vi.fn().mockResolvedValue(jsonResponse(400, { error: 'bad' }))
+    vi.stubGlobal('fetch', fetchMock)
+
+    await expect(fetchJson('https://example.com/posts', 'Example post failed')).rejects.toThrow('Example post failed: 400')
+    expect(fetchMock).toHaveBeenCalledTimes(1)
+  })
+
+  test('truncates long error bodies', async () => {
+    vi.stubGlobal('fetch', vi.fn().mockResolvedValue(new Response(`<html>${'x'.repeat(2000)}</html>`, { status: 400 })))
+
+    const error = await fetchJson('https://example.com/posts', 'Example post failed').catch((caught: Error) => caught)
+    expect((error as Error).message.length).toBeLessThan(600)
+  })
+
+  test('gives up when the server asks for a long wait', async () => {
+    const reset = String(Math.floor(Date.now() / 1000) + 900)
+    const fetchMock = vi.fn().mockResolvedValue(jsonResponse(429, { error: 'limited' }, { 'x-rate-limit-reset': reset }))
+    vi.stubGlobal('fetch', fetchMock)
+
+    await expect(fetchJson('https://example.com/posts', 'Example post failed')).rejects.toThrow('Example post failed: 429')
+    expect(fetchMock).toHaveBeenCalledTimes(1)
+  })
+})
+
+describe('fetchOk', () => {
+  test('accepts non-JSON success bodies', async () => {
+    vi.stubGlobal('fetch', vi.fn().mockResolvedValue(new Response('uploaded', { status: 201 })))
+
+    await expect(fetchOk('https://example.com/upload', 'Example upload failed', { method: 'PUT' })).resolves.toBeUndefined()
+  })
+})
@@ -1,11 +1,32 @@
-import { existsSync, readFileSync } from 'fs'
+import { readFile } from 'fs/promises'
 import { extname } from 'path'
 
 const ALLOWED_PROTOCOLS = new Set(['http:', 'https:'])
 const ALLOWED_IMAGE_TYPES = new Set(['image/png', 'image/jpeg', 'image/jpg', 'image/gif', 'image/webp'])
+// A gateway error (or a 503 without Retry-After) may arrive after the upstream
+// already acted, so these are retried only for methods safe to repeat. A bare
+// 500 is never retried.
+const GATEWAY_STATUSES = new Set([502, 503, 504])
+const MAX_RETRIES = 3
+// A dropped connection may have reached the server, so only methods that are
+// safe to repeat are retried after a network error or timeout.
+const IDEMPOTENT_METHODS = new Set(['GET', 'HEAD', 'PUT', 'DELETE'])
+const MAX_RETRY_DELAY_MS = 30_000
+// x-rate-limit-reset values below this are seconds from now, not epoch seconds.
+const EPOCH_RESET_THRESHOLD = 1e9
+// Per-attempt cap for requests that are safe to repeat, so a stalled socket
+// cannot hang a publish forever.
+const REQUEST_TIMEOUT_MS = 30_000
+// Proxy error pages can be whole HTML documents; keep only the head in messages.
+const MAX_ERROR_BODY_CHARS = 500
+
+const IPV4_PATTERN = /^(\d+)\.(\d+)\.(\d+)\.(\d+)$/
+// Internal host names and IPv6 loopback/private prefixes, matched in one pass
+// over an already-lowercased hostname.
+const INTERNAL_HOST_PATTERN = /^(?:localhost$|::1$|\[::1\]$|fc|fd|fe80)|\.(?:local|internal)$/
 
 function isPrivateIp(hostname: string): boolean {
-  const ipv4 = hostname.match(/^(\d+)\.(\d+)\.(\d+)\.(\d+)$/)
+  const ipv4 = hostname.match(IPV4_PATTERN)
   if (ipv4) {
     const [, a, b] = ipv4.map(Number)
     if (a === 10) return true
@@ -15,9 +36,7 @@ function isPrivateIp(hostname: string): boolean {
     if (a === 127) return true
     if (a === 0) return true
   }
-
-  const lower = hostname.toLowerCase()
-  return lower === '::1' || lower === '[::1]' || lower.startsWith('fc') || lower.startsWith('fd') || lower.startsWith('fe80')
+  return false
 }
 
 export function validateUrl(input: string): URL {
@@ -33,32 +52,175 @@ export function validateUrl(input: string): URL {
   }
 
   const hostname = url.hostname.toLowerCase()
-  if (hostname === 'localhost' || hostname.endsWith('.local') || hostname.endsWith('.internal') || isPrivateIp(hostname)) {
+  if (INTERNAL_HOST_PATTERN.test(hostname) || isPrivateIp(hostname)) {
     throw new Error(`Blocked internal URL: ${hostname}`)
   }
 
   return url
 }
 
+const IMAGE_EXTENSIONS: Record<string, string> = {
+  'image/png': 'png',
+  'image/jpeg': 'jpg',
+  'image/jpg': 'jpg',
+  'image/gif': 'gif',
+  'image/webp': 'webp',
+}
+
+/** Upload filename for multipart form fields, e.g. `image.png`. */
+export function imageFilename(mimeType: string): string {
+  return `image.${IMAGE_EXTENSIONS[mimeType] ?? 'jpg'}`
+}
+
+const MIME_BY_EXTENSION: Record<string, string> = {
+  '.png': 'image/png',
+  '.jpg': 'image/jpeg',
+  '.jpeg': 'image/jpeg',
+  '.gif': 'image/gif',
+  '.webp': 'image/webp',
+  '.svg': 'image/svg+xml',
+}
+
 export function getMimeType(filePath: string): string {
-  const mimeByExt: Record<string, string> = {
-    '.png': 'image/png',
-    '.jpg': 'image/jpeg',
-    '.jpeg': 'image/jpeg',
-    '.gif': 'image/gif',
-    '.webp': 'image/webp',
+  return MIME_BY_EXTENSION[extname(filePath).toLowerCase()] ?? 'application/octet-stream'
+}
+
+/**
+ * Milliseconds to wait before retrying a throttled response. Server hints
+ * (`Retry-After`, `x-rate-limit-reset`) win over exponential backoff, which
+ * adds up to a second of jitter so concurrent publishers do not retry in step.
+ */
+export function retryDelayMs(headers: Headers, attempt: number, now = Date.now(), random = Math.random): number {
+  const retryAfter = headers.get('retry-after')
+  if (retryAfter) {
+    const seconds = Number(retryAfter)
+    const delay = Number.isFinite(seconds) ? seconds * 1000 : Date.parse(retryAfter) - now
+    if (Number.isFinite(delay)) {
+      return Math.max(0, delay)
+    }
+  }
+
+  const reset = Number(headers.get('x-rate-limit-reset') ?? headers.get('x-ratelimit-reset') ?? Number.NaN)
+  if (Number.isFinite(reset)) {
+    return Math.max(0, reset < EPOCH_RESET_THRESHOLD ? reset * 1000 : reset * 1000 - now)
   }
 
-  return mimeByExt[extname(filePath).toLowerCase()] ?? 'application/octet-stream'
+  return 1000 * 2 ** attempt + Math.floor(random() * 1000)
 }
 
-export async function downloadImage(input: string): Promise<{ data: Buffer; mimeType: string }> {
-  if (input.startsWith('/') || input.startsWith('./') || input.startsWith('../')) {
-    if (!existsSync(input)) {
-      throw new Error(`File not found: ${input}`)
+/**
+ * Request options, or a factory called once per attempt for requests that
+ * must be rebuilt when resent (e.g. OAuth 1.0a signatures, which carry a
+ * single-use nonce and timestamp).
+ */
+export type FetchInit = RequestInit | (() => RequestInit)
+
+export interface FetchJsonOptions {
+  /** Sees the headers of every response, e.g. to track server-reported quota. */
+  onHeaders?: (headers: Headers) => void
+  /**
+   * Overall budget in milliseconds across every attempt and retry wait. Each
+   * attempt's timeout is capped by what remains, and no retry is scheduled
+   * past it.
+   */
+  timeoutMs?: number
+}
+
+/**
+ * A 429, or a 503 that names a Retry-After, is the server refusing before doing
+ * any work, so even a POST can be resent. Other gateway statuses are retried
+ * only when repeating the request is harmless.
+ */
+function isRetryableStatus(status: number, headers: Headers, idempotent: boolean): boolean {
+  if (status === 429) return true
+  if (status === 503 && headers.has('retry-after')) return true
+  return idempotent && GATEWAY_STATUSES.has(status)
+}
+
+/** Network failures and our own per-attempt timeouts; a caller's abort is final. */
+function isTransientFetchError(error: unknown): boolean {
+  if (error instanceof TypeError) return true
+  return error instanceof Error && error.name === 'TimeoutError'
+}
+
+async function fetchWithRetry(url: string, label: string, init: FetchInit | undefined, options: FetchJsonOptions): Promise<Response> {
+  const deadline = performance.now() + (options.timeoutMs ?? Number.POSITIVE_INFINITY)
+  for (let attempt = 0; ; attempt += 1) {
+    const request = typeof init === 'function' ? init() : init
+    const idempotent = IDEMPOTENT_METHODS.has((request?.method ?? 'GET').toUpperCase())
+    // A POST aborted client-side may still have been processed, and reporting
+    // it as failed invites a duplicate on rerun, so only requests that are
+    // safe to repeat get the default per-attempt cap.
+    const timeout = Math.min(idempotent ? REQUEST_TIMEOUT_MS : Number.POSITIVE_INFINITY, deadline - performance.now())
+    let response: Response
+    try {
+      const signal = request?.signal ?? (Number.isFinite(timeout) ? AbortSignal.timeout(Math.max(0, timeout)) : undefined)
+      response = await fetch(url, { ...request, signal })
+    } catch (error) {
+      const wait = retryDelayMs(new Headers(), attempt)
+      if (!idempotent || attempt >= MAX_RETRIES || !isTransientFetchError(error) || wait >= deadline - performance.now()) {
+        throw error
+      }
+      await new Promise((resolve) => setTimeout(resolve, wait))
+      continue
+    }
+    options.onHeaders?.(response.headers)
+    if (response.ok) {
+      return response
+    }
+
+    const body = await response.text()
+    const delay = retryDelayMs(response.headers, attempt)
+    if (!isRetryableStatus(response.status, response.headers, idempotent) || attempt >= MAX_RETRIES || delay > MAX_RETRY_DELAY_MS || delay >= deadline - performance.now()) {
+      const detail = body.length > MAX_ERROR_BODY_CHARS ? `${body.slice(0, MAX_ERROR_BODY_CHARS)}…` : body
+      throw new Error(`${label}: ${response.status} ${detail}`)
     }
 
-    const data = readFileSync(input)
+    await new Promise((resolve) => setTimeout(resolve, delay))
+  }
+}
+
+/**
+ * Fetch a JSON endpoint and always consume the response body, so the
+ * keep-alive socket goes back to fetch's shared connection pool. Throttled
+ * and gateway responses are retried unless the server asks for a wait
+ * longer than MAX_RETRY_DELAY_MS. Idempotent requests time out after
+ * REQUEST_TIMEOUT_MS per attempt unless the caller passes its own signal,
+ * and are also retried after network errors and timeouts. A timeoutMs
+ * option bounds the whole call, retries included.
+ */
+export async function fetchJson<T>(url: string, label: string, init?: FetchInit, options: FetchJsonOptions = {}): Promise<T> {
+  const response = await fetchWithRetry(url, label, init, options)
+  return await response.json() as T
+}
+
+/**
+ * Like fetchJson, for endpoints whose success body is not needed. The body
+ * is drained without being parsed so the socket can still be reused.
+ */
+export async function fetchOk(url: string, label: string, init?: FetchInit, options: FetchJsonOptions = {}): Promise<void> {
+  const response = await fetchWithRetry(url, label, init, options)
+  await response.arrayBuffer()
+}
+
+/**
+ * Read a local file in one call, reporting a missing file as `File not
+ * found` instead of racing a separate existence check against the read.
+ */
+export async function readLocalFile(filePath: string): Promise<Buffer> {
+  try {
+    return await readFile(filePath)
+  } catch (error) {
+    if ((error as NodeJS.ErrnoException).code === 'ENOENT') {
+      throw new Error(`File not found: ${filePath}`)
+    }
+    throw error
+  }
+}
+
+export async function downloadImage(input: string): Promise<{ data: Buffer; mimeType: string }> {
+  if (input.startsWith('/') || input.startsWith('./') || input.startsWith('../')) {
+    const data = await readLocalFile(input)
     const mimeType = getMimeType(input)
     if (!ALLOWED_IMAGE_TYPES.has(mimeType)) {
       throw new Error(`Invalid image type: ${mimeType}`)
@@ -68,12 +230,16 @@ export async function downloadImage(input: string): Promise<{ data: Buffer; mime
 
   validateUrl(input)
   const response = await fetch(input)
+  // Rejected responses are cancelled rather than read, which frees the
+  // connection without downloading a body nobody will use.
   if (!response.ok) {
+    await response.body?.cancel()
     throw new Error(`Failed to download image: ${response.status} ${response.statusText}`)
   }
 
   const mimeType = (response.headers.get('content-type') ?? '').split(';')[0].trim().toLowerCase()
   if (!ALLOWED_IMAGE_TYPES.has(mimeType)) {
+    await response.body?.cancel()
     throw new Error(`Invalid image type: ${mimeType}`)
   }
 
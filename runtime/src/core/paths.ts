@@ -1,4 +1,4 @@
-import { existsSync, mkdirSync, readdirSync, realpathSync } from 'fs'
+import { closeSync, existsSync, fsyncSync, mkdirSync, openSync, readdirSync, realpathSync, renameSync, rmSync, writeFileSync } from 'fs'
 import { dirname, join, resolve } from 'path'
 
 export interface RuntimePaths {
@@ -68,3 +68,25 @@ export function ensureParentDir(filePath: string): void {
     mkdirSync(parent, { recursive: true })
   }
 }
+
+/**
+ * Write through a sibling temp file, flushed to disk before it is renamed
+ * into place, so a crash mid-write never leaves a truncated file at
+ * `filePath`. A failed write removes the temp file.
+ */
+export function writeFileAtomic(filePath: string, data: string | Uint8Array): void {
+  ensureParentDir(filePath)
+  const tempPath = `${filePath}.${process.pid}.tmp`
+  try {
+    const fd = openSync(tempPath, 'w')
+    try {
+      writeFileSync(fd, data)
+      fsyncSync(fd)
+    } finally {
+      closeSync(fd)
+    }
+    renameSync(tempPath, filePath)
+  } finally {
+    rmSync(tempPath, { force: true })
+  }
+}
@@ -1,8 +1,7 @@
 import crypto from 'crypto'
-import { PutObjectCommand, S3Client } from '@aws-sdk/client-s3'
-import { existsSync, readFileSync } from 'fs'
+import type { S3Client } from '@aws-sdk/client-s3'
 import { extname } from 'path'
-import { getMimeType } from './http'
+import { getMimeType, readLocalFile } from './http'
 
 interface R2Config {
   accountId: string
@@ -12,28 +11,50 @@ interface R2Config {
   publicUrl: string
 }
 
+const R2_ENV_KEYS: Record<keyof R2Config, string> = {
+  accountId: 'R2_ACCOUNT_ID',
+  accessKeyId: 'R2_ACCESS_KEY_ID',
+  secretAccessKey: 'R2_SECRET_ACCESS_KEY',
+  bucketName: 'R2_BUCKET_NAME',
+  publicUrl: 'R2_PUBLIC_URL',
+}
+
+const R2_FIELDS = Object.keys(R2_ENV_KEYS) as Array<keyof R2Config>
+
+// Values are read from process.env at call time (not cached) because
+// loadRuntimeEnv and tests may change them after this module loads.
 function getConfig(): R2Config {
-  const config = {
-    accountId: process.env.R2_ACCOUNT_ID,
-    accessKeyId: process.env.R2_ACCESS_KEY_ID,
-    secretAccessKey: process.env.R2_SECRET_ACCESS_KEY,
-    bucketName: process.env.R2_BUCKET_NAME,
-    publicUrl: process.env.R2_PUBLIC_URL,
+  const config = {} as R2Config
+  const missing: string[] = []
+  for (const field of R2_FIELDS) {
+    const value = process.env[R2_ENV_KEYS[field]]
+    if (value) {
+      config[field] = value
+    } else {
+      missing.push(field)
+    }
   }
 
-  const missing = Object.entries(config)
-    .filter(([, value]) => !value)
-    .map(([key]) => key)
-
   if (missing.length > 0) {
     throw new Error(`R2 not configured. Missing: ${missing.join(', ')}`)
   }
 
-  return config as R2Config
+  return config
 }
 
-function createClient(config: R2Config): S3Client {
-  return new S3Client({
+// One client per account/key pair, so uploads reuse its connection pool.
+const clients = new Map<string, S3Client>()
+
+// The S3 SDK is large; load it only when an upload actually happens.
+async function getClient(config: R2Config): Promise<S3Client> {
+  const cacheKey = `${config.accountId}:${config.accessKeyId}:${config.secretAccessKey}`
+  const cached = clients.get(cacheKey)
+  if (cached) {
+    return cached
+  }
+
+  const { S3Client } = await import('@aws-sdk/client-s3')
+  const client = new S3Client({
     region: 'auto',
     endpoint: `https://${config.accountId}.r2.cloudflarestorage.com`,
     credentials: {
@@ -41,29 +62,24 @@ function createClient(config: R2Config): S3Client {
       secretAccessKey: config.secretAccessKey,
     },
   })
+  clients.set(cacheKey, client)
+  return client
 }
 
 export function isR2Configured(): boolean {
-  try {
-    getConfig()
-    return true
-  } catch {
-    return false
-  }
+  return R2_FIELDS.every((field) => Boolean(process.env[R2_ENV_KEYS[field]]))
 }
 
 export async function uploadToR2(filePath: string): Promise<string> {
-  if (!existsSync(filePath)) {
-    throw new Error(`File not found: ${filePath}`)
-  }
-
+  const fileData = await readLocalFile(filePath)
   const config = getConfig()
-  const fileData = readFileSync(filePath)
   const hash = crypto.createHash('md5').update(fileData).digest('hex').slice(0, 8)
   const ext = extname(filePath)
   const key = `loom-runtime/${Date.now()}-${hash}${ext}`
 
-  await createClient(config).send(new PutObjectCommand({
+  const { PutObjectCommand } = await import('@aws-sdk/client-s3')
+  const client = await getClient(config)
+  await client.send(new PutObjectCommand({
     Bucket: config.bucketName,
     Key: key,
     Body: fileData,
@@ -174,14 +174,18 @@ export interface PublishInput {
   platforms?: SocialPlatform[]
 }
 
+const WORKFLOW_NAME_SET: ReadonlySet<string> = new Set(WORKFLOW_NAMES)
+const SOCIAL_PLATFORM_SET: ReadonlySet<string> = new Set(SOCIAL_PLATFORMS)
+const STEP_NAME_SET: ReadonlySet<string> = new Set(STEP_NAMES)
+
 export function isWorkflowName(value: string): value is WorkflowName {
-  return WORKFLOW_NAMES.includes(value as WorkflowName)
+  return WORKFLOW_NAME_SET.has(value)
 }
 
 export function isSocialPlatform(value: string): value is SocialPlatform {
-  return SOCIAL_PLATFORMS.includes(value as SocialPlatform)
+  return SOCIAL_PLATFORM_SET.has(value)
 }
 
 export function isStepName(value: string): value is StepName {
-  return STEP_NAMES.includes(value as StepName)
+  return STEP_NAME_SET.has(value)
 }
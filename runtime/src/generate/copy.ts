@@ -21,6 +21,14 @@ interface SocialDraftOptions {
   perspective?: string
 }
 
+interface TemplateFallbackOptions extends SocialDraftOptions {
+  headline: string
+  cta: string
+}
+
+// Opening (```json) and closing (```) fences in one pass.
+const CODE_FENCE = /```(?:json)?\s*/g
+
 function compact(value: string): string {
   return value.replace(/\s+/g, ' ').trim()
 }
@@ -34,7 +42,15 @@ function resolveCtaFromBrand(brand: BrandFoundation): string {
   return brand.channels.social.objective
 }
 
+// Brand foundations are not mutated after loading, so the prompt can be cached per object.
+const voicePromptCache = new WeakMap<BrandFoundation, string>()
+
 function buildVoicePrompt(brand: BrandFoundation): string {
+  const cached = voicePromptCache.get(brand)
+  if (cached !== undefined) {
+    return cached
+  }
+
   const lines: string[] = [
     `You are writing social copy for ${brand.name}.`,
     `Positioning: ${brand.positioning}`,
@@ -48,7 +64,9 @@ function buildVoicePrompt(brand: BrandFoundation): string {
   if (brand.proofPoints.length > 0) {
     lines.push('', 'Evidence you can use:', ...brand.proofPoints.map(p => `- ${p}`))
   }
-  return lines.join('\n')
+  const prompt = lines.join('\n')
+  voicePromptCache.set(brand, prompt)
+  return prompt
 }
 
 function buildImageDirection(brand: BrandFoundation, topic: string): string {
@@ -60,7 +78,7 @@ function buildImageDirection(brand: BrandFoundation, topic: string): string {
 function parseVariants(raw: string, cta: string): SocialDraftVariant[] | null {
   // Expect JSON array of [{hook, body}] or object with {main: {hook, body}, alt: {hook, body}}
   try {
-    const cleaned = raw.replace(/```json\s*/g, '').replace(/```\s*/g, '').trim()
+    const cleaned = raw.replace(CODE_FENCE, '').trim()
     const parsed = JSON.parse(cleaned)
 
     if (Array.isArray(parsed) && parsed.length >= 2) {
@@ -82,19 +100,17 @@ function parseVariants(raw: string, cta: string): SocialDraftVariant[] | null {
   return null
 }
 
-function templateFallback(options: SocialDraftOptions): SocialDraftVariant[] {
-  const { brand, topic, perspective } = options
+function templateFallback(options: TemplateFallbackOptions): SocialDraftVariant[] {
+  const { brand, topic, perspective, headline, cta } = options
   const audience = brand.audiences[0]?.summary ?? 'the audience'
   const evidence = brand.proofPoints[0] ?? brand.positioning
   const angle = perspective ?? brand.positioning
   const dont = brand.voice.dont[0] ?? 'generic language'
-  const cta = resolveCtaFromBrand(brand)
-  const cap = topic.charAt(0).toUpperCase() + topic.slice(1)
 
   return [
     {
       id: 'social-main',
-      hook: `${cap} is usually treated like a personal problem. It is not.`,
+      hook: `${headline} is usually treated like a personal problem. It is not.`,
       body: compact(`${brand.name} frames it as a systems issue for ${audience}. ${angle} ${evidence}`),
       cta,
     },
@@ -110,6 +126,8 @@ function templateFallback(options: SocialDraftOptions): SocialDraftVariant[] {
 export async function generateSocialDraftSet(options: SocialDraftOptions): Promise<SocialDraftSet> {
   const { brand } = options
   const topic = options.topic.trim().replace(/\s+/g, ' ')
+  const headline = topic.charAt(0).toUpperCase() + topic.slice(1)
+  // Resolved once and shared by the parsed variants and the template fallback.
   const cta = resolveCtaFromBrand(brand)
 
   const prompt = [
@@ -130,8 +148,8 @@ export async function generateSocialDraftSet(options: SocialDraftOptions): Promi
 
   return {
     channel: 'social',
-    headline: topic.charAt(0).toUpperCase() + topic.slice(1),
+    headline,
     imageDirection: buildImageDirection(brand, topic),
-    variants: parsed ?? templateFallback(options),
+    variants: parsed ?? templateFallback({ ...options, topic, headline, cta }),
   }
 }
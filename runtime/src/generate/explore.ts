@@ -6,7 +6,7 @@ import { writeFileSync } from 'fs'
 import { join } from 'path'
 import type { BrandFoundation } from '../domain/types'
 import { ensureParentDir, type RuntimePaths } from '../core/paths'
-import { generateImage } from '../render/gemini'
+import { fillImagePrompt, generateImage } from '../render/gemini'
 
 interface ExploreGridOptions {
   brand: BrandFoundation
@@ -23,7 +23,7 @@ interface ExploreGridResult {
 
 function buildPrompt(brand: BrandFoundation, topic: string): string {
   if (brand.visual.imagePrompt) {
-    const basePrompt = brand.visual.imagePrompt.replace(/\[SUBJECT\]/gi, topic)
+    const basePrompt = fillImagePrompt(brand.visual.imagePrompt, topic)
     return [
       'Generate a 3x3 mood board grid (3:4 aspect ratio) with nine panels separated by clean visible grid lines.',
       'Each panel should be a distinct variation using this visual system:',
@@ -6,7 +6,7 @@ import { writeFileSync } from 'fs'
 import { join } from 'path'
 import type { BrandFoundation } from '../domain/types'
 import { ensureParentDir, type RuntimePaths } from '../core/paths'
-import { generateImage } from '../render/gemini'
+import { fillImagePrompt, generateImage } from '../render/gemini'
 
 interface SourceImageOptions {
   brand: BrandFoundation
@@ -17,7 +17,7 @@ interface SourceImageOptions {
 
 function buildPrompt(brand: BrandFoundation, topic: string): string {
   if (brand.visual.imagePrompt) {
-    return brand.visual.imagePrompt.replace(/\[SUBJECT\]/gi, topic)
+    return fillImagePrompt(brand.visual.imagePrompt, topic)
   }
   return [
     `A warm, abstract visual about ${topic}.`,
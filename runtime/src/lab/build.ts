@@ -1,5 +1,6 @@
-import { existsSync, readFileSync } from 'fs'
-import { extname, join } from 'path'
+import { readFileSync } from 'fs'
+import { join } from 'path'
+import { getMimeType } from '../core/http'
 import type { BrandFoundation } from '../domain/types'
 
 export const CARD_LAB_TYPES = ['quote', 'hero-stat', 'fact-list', 'signal-post', 'photo-text'] as const
@@ -44,30 +45,16 @@ interface CardLabBootData {
   }
 }
 
-function imageMimeType(path: string): string {
-  switch (extname(path).toLowerCase()) {
-    case '.png':
-      return 'image/png'
-    case '.jpg':
-    case '.jpeg':
-      return 'image/jpeg'
-    case '.gif':
-      return 'image/gif'
-    case '.webp':
-      return 'image/webp'
-    case '.svg':
-      return 'image/svg+xml'
-    default:
-      return 'application/octet-stream'
-  }
-}
-
 function maybeEmbedLogo(brand: BrandFoundation, brandAssetBasePath: string): string | undefined {
   if (!brand.visual.logo) return undefined
   const filePath = join(brandAssetBasePath, brand.visual.logo)
-  if (!existsSync(filePath)) return undefined
-  const bytes = readFileSync(filePath)
-  return `data:${imageMimeType(filePath)};base64,${bytes.toString('base64')}`
+  let bytes: Buffer
+  try {
+    bytes = readFileSync(filePath)
+  } catch {
+    return undefined
+  }
+  return `data:${getMimeType(filePath)};base64,${bytes.toString('base64')}`
 }
 
 function fallbackHeadline(brand: BrandFoundation): string {
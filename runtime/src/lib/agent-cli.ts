@@ -35,6 +35,8 @@ export async function doctorRunner(
   const width = Math.max(...checks.map((c) => c.name.length), 0);
   let failures = 0;
 
+  // Build the whole report, then write it once rather than once per line.
+  let report = "";
   for (const c of checks) {
     let ok = false;
     let hint = c.hint ?? "";
@@ -47,16 +49,16 @@ export async function doctorRunner(
     const mark = ok ? "PASS" : "FAIL";
     let line = `  [${mark}] ${c.name.padEnd(width)}`;
     if (!ok && hint) line += `  — ${hint}`;
-    process.stderr.write(line + "\n");
+    report += line + "\n";
     if (!ok) failures += 1;
   }
 
   if (failures > 0) {
-    process.stderr.write(`\ndoctor: ${failures} check(s) failed\n`);
+    process.stderr.write(`${report}\ndoctor: ${failures} check(s) failed\n`);
     if (exitOnFail) process.exit(1);
     return 1;
   }
-  process.stderr.write("\ndoctor: all checks passed\n");
+  process.stderr.write(`${report}\ndoctor: all checks passed\n`);
   return 0;
 }
 
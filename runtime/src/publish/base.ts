@@ -5,6 +5,23 @@ export interface AdapterPostResult {
   error?: string
 }
 
+// App-level credentials that may be shared by every brand on a platform.
+const SHARED_CREDENTIAL_SUFFIXES: Record<string, ReadonlySet<string>> = {
+  TWITTER: new Set(['API_KEY', 'API_SECRET']),
+}
+
+/**
+ * Read `<PLATFORM>_<BRAND>_<SUFFIX>`, falling back to `<PLATFORM>_<SUFFIX>`
+ * only for suffixes the platform allows to be shared.
+ */
+export function readCredential(platform: string, brandUpper: string, suffix: string): string | undefined {
+  const value = process.env[`${platform}_${brandUpper}_${suffix}`]
+  if (value !== undefined || !SHARED_CREDENTIAL_SUFFIXES[platform]?.has(suffix)) {
+    return value
+  }
+  return process.env[`${platform}_${suffix}`]
+}
+
 export function createCredentialGetter<T>(
   platform: string,
   requiredFields: Array<{ suffix: string; field: keyof T }>
@@ -14,7 +31,7 @@ export function createCredentialGetter<T>(
     const result = {} as T
 
     for (const { suffix, field } of requiredFields) {
-      const value = process.env[`${platform}_${brandUpper}_${suffix}`]
+      const value = readCredential(platform, brandUpper, suffix)
       if (!value) {
         throw new Error(`${platform}_${brandUpper}_${suffix} not set`)
       }
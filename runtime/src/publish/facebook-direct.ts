@@ -1,4 +1,4 @@
-import { downloadImage } from '../core/http'
+import { downloadImage, fetchJson, imageFilename } from '../core/http'
 import { createCredentialGetter, type AdapterPostResult } from './base'
 
 interface FacebookCredentials {
@@ -6,13 +6,15 @@ interface FacebookCredentials {
   pageId: string
 }
 
+const GRAPH_API_ROOT = 'https://graph.facebook.com/v21.0'
+
 const getCredentials = createCredentialGetter<FacebookCredentials>('FACEBOOK', [
   { suffix: 'PAGE_ACCESS_TOKEN', field: 'pageAccessToken' },
   { suffix: 'PAGE_ID', field: 'pageId' },
 ])
 
 async function createTextPost(text: string, credentials: FacebookCredentials): Promise<string> {
-  const response = await fetch(`https://graph.facebook.com/v21.0/${credentials.pageId}/feed`, {
+  const payload = await fetchJson<{ id: string }>(`${GRAPH_API_ROOT}/${credentials.pageId}/feed`, 'Facebook text post failed', {
     method: 'POST',
     headers: {
       'Content-Type': 'application/json',
@@ -22,34 +24,21 @@ async function createTextPost(text: string, credentials: FacebookCredentials): P
       access_token: credentials.pageAccessToken,
     }),
   })
-
-  if (!response.ok) {
-    throw new Error(`Facebook text post failed: ${response.status} ${await response.text()}`)
-  }
-
-  const payload = await response.json() as { id: string }
   return payload.id
 }
 
 async function uploadAndPublishPhoto(imagePath: string, text: string, credentials: FacebookCredentials): Promise<string> {
   const { data, mimeType } = await downloadImage(imagePath)
   const form = new FormData()
-  const extension = mimeType.includes('png') ? 'png' : 'jpg'
-  form.append('source', new Blob([new Uint8Array(data)], { type: mimeType }), `image.${extension}`)
+  form.append('source', new Blob([new Uint8Array(data)], { type: mimeType }), imageFilename(mimeType))
   form.append('message', text)
   form.append('published', 'true')
   form.append('access_token', credentials.pageAccessToken)
 
-  const response = await fetch(`https://graph.facebook.com/v21.0/${credentials.pageId}/photos`, {
+  const payload = await fetchJson<{ id: string; post_id?: string }>(`${GRAPH_API_ROOT}/${credentials.pageId}/photos`, 'Facebook photo upload failed', {
     method: 'POST',
     body: form,
   })
-
-  if (!response.ok) {
-    throw new Error(`Facebook photo upload failed: ${response.status} ${await response.text()}`)
-  }
-
-  const payload = await response.json() as { id: string; post_id?: string }
   return payload.post_id ?? payload.id
 }
 
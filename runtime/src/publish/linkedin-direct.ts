@@ -1,4 +1,4 @@
-import { downloadImage } from '../core/http'
+import { downloadImage, fetchJson, fetchOk } from '../core/http'
 import { createCredentialGetter, type AdapterPostResult } from './base'
 
 interface LinkedInCredentials {
@@ -6,51 +6,76 @@ interface LinkedInCredentials {
   orgId: string
 }
 
-const getCredentials = createCredentialGetter<LinkedInCredentials>('LINKEDIN', [
+interface LinkedInAuthor {
+  accessToken: string
+  orgUrn: string
+}
+
+const ORGANIZATION_URN_PREFIX = 'urn:li:organization:'
+const REGISTER_UPLOAD_URL = 'https://api.linkedin.com/v2/assets?action=registerUpload'
+const UGC_POSTS_URL = 'https://api.linkedin.com/v2/ugcPosts'
+const UPLOAD_MECHANISM = 'com.linkedin.digitalmedia.uploading.MediaUploadHttpRequest'
+const FEED_IMAGE_RECIPES = ['urn:li:digitalmediaRecipe:feedshare-image']
+const OWNER_RELATIONSHIPS = [{ relationshipType: 'OWNER', identifier: 'urn:li:userGeneratedContent' }]
+
+function jsonHeaders(accessToken: string): Record<string, string> {
+  return {
+    Authorization: `Bearer ${accessToken}`,
+    'Content-Type': 'application/json',
+    'X-Restli-Protocol-Version': '2.0.0',
+  }
+}
+
+const readCredentials = createCredentialGetter<LinkedInCredentials>('LINKEDIN', [
   { suffix: 'ACCESS_TOKEN', field: 'accessToken' },
   { suffix: 'ORG_ID', field: 'orgId' },
 ])
 
-async function uploadImage(imagePath: string, credentials: LinkedInCredentials): Promise<string> {
-  const registerResponse = await fetch('https://api.linkedin.com/v2/assets?action=registerUpload', {
+/** ORG_ID may be a bare id or a full organization URN; both resolve to the URN once. */
+function getCredentials(brand: string): LinkedInAuthor {
+  const { accessToken, orgId } = readCredentials(brand)
+  return {
+    accessToken,
+    orgUrn: orgId.startsWith(ORGANIZATION_URN_PREFIX) ? orgId : `${ORGANIZATION_URN_PREFIX}${orgId}`,
+  }
+}
+
+interface RegisteredUpload {
+  asset: string
+  uploadUrl: string
+}
+
+async function registerUpload(credentials: LinkedInAuthor): Promise<RegisteredUpload> {
+  const registerData = await fetchJson<{
+    value: {
+      asset: string
+      uploadMechanism: Record<typeof UPLOAD_MECHANISM, { uploadUrl: string }>
+    }
+  }>(REGISTER_UPLOAD_URL, 'LinkedIn image register failed', {
     method: 'POST',
-    headers: {
-      Authorization: `Bearer ${credentials.accessToken}`,
-      'Content-Type': 'application/json',
-      'X-Restli-Protocol-Version': '2.0.0',
-    },
+    headers: jsonHeaders(credentials.accessToken),
     body: JSON.stringify({
       registerUploadRequest: {
-        recipes: ['urn:li:digitalmediaRecipe:feedshare-image'],
-        owner: `urn:li:organization:${credentials.orgId}`,
-        serviceRelationships: [
-          {
-            relationshipType: 'OWNER',
-            identifier: 'urn:li:userGeneratedContent',
-          },
-        ],
+        recipes: FEED_IMAGE_RECIPES,
+        owner: credentials.orgUrn,
+        serviceRelationships: OWNER_RELATIONSHIPS,
       },
     }),
   })
 
-  if (!registerResponse.ok) {
-    throw new Error(`LinkedIn image register failed: ${registerResponse.status} ${await registerResponse.text()}`)
-  }
-
-  const registerData = await registerResponse.json() as {
-    value: {
-      asset: string
-      uploadMechanism: {
-        'com.linkedin.digitalmedia.uploading.MediaUploadHttpRequest': {
-          uploadUrl: string
-        }
-      }
-    }
+  return {
+    asset: registerData.value.asset,
+    uploadUrl: registerData.value.uploadMechanism[UPLOAD_MECHANISM].uploadUrl,
   }
+}
 
-  const uploadUrl = registerData.value.uploadMechanism['com.linkedin.digitalmedia.uploading.MediaUploadHttpRequest'].uploadUrl
-  const { data } = await downloadImage(imagePath)
-  const uploadResponse = await fetch(uploadUrl, {
+async function uploadImage(imagePath: string, credentials: LinkedInAuthor): Promise<string> {
+  // Registering the asset and reading the image are independent round trips.
+  const [{ asset, uploadUrl }, { data }] = await Promise.all([
+    registerUpload(credentials),
+    downloadImage(imagePath),
+  ])
+  await fetchOk(uploadUrl, 'LinkedIn image upload failed', {
     method: 'PUT',
     headers: {
       Authorization: `Bearer ${credentials.accessToken}`,
@@ -59,14 +84,10 @@ async function uploadImage(imagePath: string, credentials: LinkedInCredentials):
     body: new Uint8Array(data),
   })
 
-  if (!uploadResponse.ok) {
-    throw new Error(`LinkedIn image upload failed: ${uploadResponse.status} ${await uploadResponse.text()}`)
-  }
-
-  return registerData.value.asset
+  return asset
 }
 
-async function createPost(text: string, credentials: LinkedInCredentials, imageAsset?: string): Promise<string> {
+async function createPost(text: string, credentials: LinkedInAuthor, imageAsset?: string): Promise<string> {
   const shareContent: Record<string, unknown> = {
     shareCommentary: { text },
     shareMediaCategory: imageAsset ? 'IMAGE' : 'NONE',
@@ -76,15 +97,11 @@ async function createPost(text: string, credentials: LinkedInCredentials, imageA
     shareContent.media = [{ status: 'READY', media: imageAsset }]
   }
 
-  const response = await fetch('https://api.linkedin.com/v2/ugcPosts', {
+  const payload = await fetchJson<{ id: string }>(UGC_POSTS_URL, 'LinkedIn post creation failed', {
     method: 'POST',
-    headers: {
-      Authorization: `Bearer ${credentials.accessToken}`,
-      'Content-Type': 'application/json',
-      'X-Restli-Protocol-Version': '2.0.0',
-    },
+    headers: jsonHeaders(credentials.accessToken),
     body: JSON.stringify({
-      author: `urn:li:organization:${credentials.orgId}`,
+      author: credentials.orgUrn,
       lifecycleState: 'PUBLISHED',
       specificContent: {
         'com.linkedin.ugc.ShareContent': shareContent,
@@ -94,12 +111,6 @@ async function createPost(text: string, credentials: LinkedInCredentials, imageA
       },
     }),
   })
-
-  if (!response.ok) {
-    throw new Error(`LinkedIn post creation failed: ${response.status} ${await response.text()}`)
-  }
-
-  const payload = await response.json() as { id: string }
   return payload.id
 }
 
@@ -1,4 +1,5 @@
 import { loadBrandFoundation } from '../brands/load'
+import { fetchJson } from '../core/http'
 import { uploadToR2 } from '../core/r2'
 import type { AdapterPostResult } from './base'
 import { createCredentialGetter } from './base'
@@ -11,8 +12,8 @@ interface MetaCredentials {
 }
 
 interface PlatformConfig {
-  baseUrl: string
-  apiVersion: string
+  /** Versioned API root, e.g. `https://graph.instagram.com/v21.0`. */
+  apiRoot: string
   containerEndpoint: string
   publishEndpoint: string
   statusField: string
@@ -20,38 +21,41 @@ interface PlatformConfig {
 
 const CONFIG: Record<MetaPlatform, PlatformConfig> = {
   instagram: {
-    baseUrl: 'https://graph.instagram.com',
-    apiVersion: 'v21.0',
+    apiRoot: 'https://graph.instagram.com/v21.0',
     containerEndpoint: 'media',
     publishEndpoint: 'media_publish',
     statusField: 'status_code',
   },
   threads: {
-    baseUrl: 'https://graph.threads.net',
-    apiVersion: 'v1.0',
+    apiRoot: 'https://graph.threads.net/v1.0',
     containerEndpoint: 'threads',
     publishEndpoint: 'threads_publish',
     statusField: 'status',
   },
 }
 
-const getInstagramCredentials = createCredentialGetter<MetaCredentials>('INSTAGRAM', [
-  { suffix: 'ACCESS_TOKEN', field: 'accessToken' },
-  { suffix: 'USER_ID', field: 'userId' },
-])
-
-const getThreadsCredentials = createCredentialGetter<MetaCredentials>('THREADS', [
-  { suffix: 'ACCESS_TOKEN', field: 'accessToken' },
-  { suffix: 'USER_ID', field: 'userId' },
-])
+// Container processing budget, matching the previous 60 polls at 500ms.
+const CONTAINER_TIMEOUT_MS = 30_000
+const CONTAINER_POLL_INITIAL_MS = 250
+const CONTAINER_POLL_MAX_MS = 5_000
+
+const CREDENTIAL_GETTERS: Record<MetaPlatform, (brand: string) => MetaCredentials> = {
+  instagram: createCredentialGetter<MetaCredentials>('INSTAGRAM', [
+    { suffix: 'ACCESS_TOKEN', field: 'accessToken' },
+    { suffix: 'USER_ID', field: 'userId' },
+  ]),
+  threads: createCredentialGetter<MetaCredentials>('THREADS', [
+    { suffix: 'ACCESS_TOKEN', field: 'accessToken' },
+    { suffix: 'USER_ID', field: 'userId' },
+  ]),
+}
 
 function getCredentials(platform: MetaPlatform, brand: string): MetaCredentials {
-  return platform === 'instagram' ? getInstagramCredentials(brand) : getThreadsCredentials(brand)
+  return CREDENTIAL_GETTERS[platform](brand)
 }
 
 function buildUrl(platform: MetaPlatform, path: string, params?: URLSearchParams): string {
-  const config = CONFIG[platform]
-  return `${config.baseUrl}/${config.apiVersion}/${path}${params ? `?${params.toString()}` : ''}`
+  return `${CONFIG[platform].apiRoot}/${path}${params ? `?${params.toString()}` : ''}`
 }
 
 async function createContainer(platform: MetaPlatform, credentials: MetaCredentials, text: string, imageUrl?: string): Promise<string> {
@@ -73,35 +77,46 @@ async function createContainer(platform: MetaPlatform, credentials: MetaCredenti
     }
   }
 
-  const response = await fetch(buildUrl(platform, `${credentials.userId}/${CONFIG[platform].containerEndpoint}`), {
+  const payload = await fetchJson<{ id: string }>(buildUrl(platform, `${credentials.userId}/${CONFIG[platform].containerEndpoint}`), `${platform} container creation failed`, {
     method: 'POST',
     headers: {
       'Content-Type': 'application/x-www-form-urlencoded',
     },
     body: params,
   })
-
-  if (!response.ok) {
-    throw new Error(`${platform} container creation failed: ${response.status} ${await response.text()}`)
-  }
-
-  const payload = await response.json() as { id: string }
   return payload.id
 }
 
 async function waitForContainer(platform: MetaPlatform, containerId: string, accessToken: string): Promise<void> {
   const config = CONFIG[platform]
-  for (let attempt = 0; attempt < 60; attempt += 1) {
-    const response = await fetch(buildUrl(platform, containerId, new URLSearchParams({
-      fields: config.statusField,
-      access_token: accessToken,
-    })))
+  // The status URL is the same for every poll, so build it once.
+  const statusUrl = buildUrl(platform, containerId, new URLSearchParams({
+    fields: config.statusField,
+    access_token: accessToken,
+  }))
+  const label = `${platform} status check failed`
+  // Poll quickly at first, since most containers finish within a second, then
+  // back off. The deadline uses the monotonic clock so wall-clock jumps cannot
+  // stretch or cut short the wait.
+  const deadline = performance.now() + CONTAINER_TIMEOUT_MS
+  let delay = CONTAINER_POLL_INITIAL_MS
+  while (true) {
+    const remaining = deadline - performance.now()
+    if (remaining <= 0) {
+      throw new Error(`${platform} container processing timed out`)
+    }
 
-    if (!response.ok) {
-      throw new Error(`${platform} status check failed: ${response.status}`)
+    // Each poll, retries included, may spend only what is left of the budget.
+    let payload: Record<string, string>
+    try {
+      payload = await fetchJson<Record<string, string>>(statusUrl, label, undefined, { timeoutMs: remaining })
+    } catch (error) {
+      if (error instanceof Error && error.name === 'TimeoutError') {
+        throw new Error(`${platform} container processing timed out`)
+      }
+      throw error
     }
 
-    const payload = await response.json() as Record<string, string>
     const status = payload[config.statusField]
     if (status === 'FINISHED') {
       return
@@ -110,14 +125,13 @@ async function waitForContainer(platform: MetaPlatform, containerId: string, acc
       throw new Error(`${platform} container processing failed`)
     }
 
-    await new Promise((resolve) => setTimeout(resolve, 500))
+    await new Promise((resolve) => setTimeout(resolve, Math.max(0, Math.min(delay, deadline - performance.now()))))
+    delay = Math.min(delay * 1.5, CONTAINER_POLL_MAX_MS)
   }
-
-  throw new Error(`${platform} container processing timed out`)
 }
 
 async function publishContainer(platform: MetaPlatform, credentials: MetaCredentials, containerId: string): Promise<string> {
-  const response = await fetch(buildUrl(platform, `${credentials.userId}/${CONFIG[platform].publishEndpoint}`), {
+  const payload = await fetchJson<{ id: string }>(buildUrl(platform, `${credentials.userId}/${CONFIG[platform].publishEndpoint}`), `${platform} publish failed`, {
     method: 'POST',
     headers: {
       'Content-Type': 'application/x-www-form-urlencoded',
@@ -127,27 +141,20 @@ async function publishContainer(platform: MetaPlatform, credentials: MetaCredent
       access_token: credentials.accessToken,
     }),
   })
-
-  if (!response.ok) {
-    throw new Error(`${platform} publish failed: ${response.status} ${await response.text()}`)
-  }
-
-  const payload = await response.json() as { id: string }
   return payload.id
 }
 
 async function getInstagramPermalink(mediaId: string, accessToken: string): Promise<string> {
-  const response = await fetch(`https://graph.instagram.com/v21.0/${mediaId}?${new URLSearchParams({
-    fields: 'permalink',
-    access_token: accessToken,
-  }).toString()}`)
-
-  if (!response.ok) {
-    return `https://www.instagram.com/p/${mediaId}/`
+  const fallback = `https://www.instagram.com/p/${mediaId}/`
+  try {
+    const payload = await fetchJson<{ permalink?: string }>(buildUrl('instagram', mediaId, new URLSearchParams({
+      fields: 'permalink',
+      access_token: accessToken,
+    })), 'instagram permalink lookup failed')
+    return payload.permalink ?? fallback
+  } catch {
+    return fallback
   }
-
-  const payload = await response.json() as { permalink?: string }
-  return payload.permalink ?? `https://www.instagram.com/p/${mediaId}/`
 }
 
 function getThreadsUrl(brand: string, postId: string, root?: string): string {
@@ -163,18 +170,28 @@ async function resolvePublicImageUrl(imagePath: string): Promise<string> {
   return uploadToR2(imagePath)
 }
 
-export async function postToInstagram(brand: string, text: string, imagePath: string): Promise<AdapterPostResult> {
+/**
+ * Shared container flow for both Meta platforms: create, wait, publish.
+ * Only the permalink lookup differs between Instagram and Threads.
+ */
+async function postViaContainer(
+  platform: MetaPlatform,
+  brand: string,
+  text: string,
+  imagePath: string | undefined,
+  resolvePostUrl: (postId: string, credentials: MetaCredentials) => string | Promise<string>,
+): Promise<AdapterPostResult> {
   try {
-    const credentials = getCredentials('instagram', brand)
-    const imageUrl = await resolvePublicImageUrl(imagePath)
-    const containerId = await createContainer('instagram', credentials, text, imageUrl)
-    await waitForContainer('instagram', containerId, credentials.accessToken)
-    const id = await publishContainer('instagram', credentials, containerId)
+    const credentials = getCredentials(platform, brand)
+    const imageUrl = imagePath ? await resolvePublicImageUrl(imagePath) : undefined
+    const containerId = await createContainer(platform, credentials, text, imageUrl)
+    await waitForContainer(platform, containerId, credentials.accessToken)
+    const id = await publishContainer(platform, credentials, containerId)
 
     return {
       success: true,
       postId: id,
-      postUrl: await getInstagramPermalink(id, credentials.accessToken),
+      postUrl: await resolvePostUrl(id, credentials),
     }
   } catch (error) {
     return {
@@ -184,23 +201,10 @@ export async function postToInstagram(brand: string, text: string, imagePath: st
   }
 }
 
-export async function postToThreads(brand: string, text: string, imagePath?: string, root?: string): Promise<AdapterPostResult> {
-  try {
-    const credentials = getCredentials('threads', brand)
-    const imageUrl = imagePath ? await resolvePublicImageUrl(imagePath) : undefined
-    const containerId = await createContainer('threads', credentials, text, imageUrl)
-    await waitForContainer('threads', containerId, credentials.accessToken)
-    const id = await publishContainer('threads', credentials, containerId)
+export function postToInstagram(brand: string, text: string, imagePath: string): Promise<AdapterPostResult> {
+  return postViaContainer('instagram', brand, text, imagePath, (id, credentials) => getInstagramPermalink(id, credentials.accessToken))
+}
 
-    return {
-      success: true,
-      postId: id,
-      postUrl: getThreadsUrl(brand, id, root),
-    }
-  } catch (error) {
-    return {
-      success: false,
-      error: error instanceof Error ? error.message : String(error),
-    }
-  }
+export function postToThreads(brand: string, text: string, imagePath?: string, root?: string): Promise<AdapterPostResult> {
+  return postViaContainer('threads', brand, text, imagePath, (id) => getThreadsUrl(brand, id, root))
 }
@@ -8,6 +8,27 @@ const PLATFORM_LIMITS: Record<string, { requestsPerWindow: number; windowMs: num
 }
 
 const state = new Map<string, number[]>()
+// Epoch ms until which the platform itself reported the quota as spent.
+const exhaustedUntil = new Map<string, number>()
+
+/**
+ * Learn from `x-rate-limit-remaining` / `x-rate-limit-reset` response headers,
+ * so the next post is refused locally instead of spending a request on a 429.
+ */
+export function recordRateLimitHeaders(platform: string, brand: string, headers: Headers): void {
+  const remaining = Number(headers.get('x-rate-limit-remaining') ?? Number.NaN)
+  const reset = Number(headers.get('x-rate-limit-reset') ?? Number.NaN)
+  if (!Number.isFinite(remaining) || !Number.isFinite(reset)) {
+    return
+  }
+
+  const key = `${platform}:${brand}`
+  if (remaining <= 0) {
+    exhaustedUntil.set(key, reset * 1000)
+  } else {
+    exhaustedUntil.delete(key)
+  }
+}
 
 export function checkRateLimit(platform: string, brand: string): {
   allowed: boolean
@@ -15,18 +36,38 @@ export function checkRateLimit(platform: string, brand: string): {
 } {
   const config = PLATFORM_LIMITS[platform] ?? PLATFORM_LIMITS.default
   const key = `${platform}:${brand}`
-  const requests = (state.get(key) ?? []).filter((value) => value > Date.now() - config.windowMs)
+  const now = Date.now()
+  const resetAt = exhaustedUntil.get(key)
+  if (resetAt !== undefined) {
+    if (resetAt > now) {
+      return { allowed: false, waitMs: resetAt - now }
+    }
+    exhaustedUntil.delete(key)
+  }
+  let requests = state.get(key)
+  if (!requests) {
+    requests = []
+    state.set(key, requests)
+  }
+
+  // Timestamps are appended in order, so expired entries form a prefix that
+  // can be dropped in place and the oldest live entry is always first.
+  const cutoff = now - config.windowMs
+  let expired = 0
+  while (expired < requests.length && requests[expired] <= cutoff) {
+    expired += 1
+  }
+  if (expired > 0) {
+    requests.splice(0, expired)
+  }
 
   if (requests.length >= config.requestsPerWindow) {
-    const oldest = Math.min(...requests)
-    state.set(key, requests)
     return {
       allowed: false,
-      waitMs: Math.max(0, oldest + config.windowMs - Date.now()),
+      waitMs: Math.max(0, requests[0] + config.windowMs - now),
     }
   }
 
-  requests.push(Date.now())
-  state.set(key, requests)
+  requests.push(now)
   return { allowed: true }
 }
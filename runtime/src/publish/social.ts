@@ -1,10 +1,7 @@
 import { SOCIAL_PLATFORMS, type PublishInput, type SocialPlatform } from '../domain/types'
 import { isR2Configured } from '../core/r2'
-import { postToFacebook } from './facebook-direct'
-import { postToLinkedIn } from './linkedin-direct'
-import { postToInstagram, postToThreads } from './meta-graph'
+import { readCredential, type AdapterPostResult } from './base'
 import { checkRateLimit } from './rate-limit'
-import { postToTwitter } from './twitter-direct'
 
 export interface SocialPlatformAuthStatus {
   platform: SocialPlatform
@@ -47,25 +44,35 @@ const PLATFORM_REQUIREMENTS: Record<SocialPlatform, string[]> = {
   threads: ['ACCESS_TOKEN', 'USER_ID'],
 }
 
-export const ALL_SOCIAL_PLATFORMS: SocialPlatform[] = [...SOCIAL_PLATFORMS]
+// Meta's Graph APIs fetch media by URL, so local assets must be hosted on R2 first.
+const PUBLIC_MEDIA_PLATFORMS: ReadonlySet<SocialPlatform> = new Set(['instagram', 'threads'])
 
-function resolveValue(platform: SocialPlatform, brand: string, suffix: string): string | undefined {
-  const upper = brand.toUpperCase()
-
-  if (platform === 'twitter' && (suffix === 'API_KEY' || suffix === 'API_SECRET')) {
-    return process.env[`TWITTER_${upper}_${suffix}`] ?? process.env[`TWITTER_${suffix}`]
-  }
+type PlatformPoster = (brand: string, text: string, imagePath: string, root?: string) => Promise<AdapterPostResult>
 
-  return process.env[`${platform.toUpperCase()}_${upper}_${suffix}`]
+// Adapters are imported on first use so auth checks and dry runs never load them.
+const PLATFORM_POSTERS: Record<SocialPlatform, PlatformPoster> = {
+  twitter: async (brand, text, imagePath) => (await import('./twitter-direct')).postToTwitter(brand, text, imagePath),
+  linkedin: async (brand, text, imagePath) => (await import('./linkedin-direct')).postToLinkedIn(brand, text, imagePath),
+  facebook: async (brand, text, imagePath) => (await import('./facebook-direct')).postToFacebook(brand, text, imagePath),
+  instagram: async (brand, text, imagePath) => (await import('./meta-graph')).postToInstagram(brand, text, imagePath),
+  threads: async (brand, text, imagePath, root) => (await import('./meta-graph')).postToThreads(brand, text, imagePath, root),
 }
 
+export const ALL_SOCIAL_PLATFORMS: readonly SocialPlatform[] = SOCIAL_PLATFORMS
+
 export function getSocialAuthReport(brand: string): SocialAuthReport {
   const r2Configured = isR2Configured()
+  const upper = brand.toUpperCase()
+  const available: SocialPlatform[] = []
   const platforms = ALL_SOCIAL_PLATFORMS.map((platform) => {
-    const missing = PLATFORM_REQUIREMENTS[platform].filter((suffix) => !resolveValue(platform, brand, suffix))
-    if ((platform === 'instagram' || platform === 'threads') && !r2Configured) {
+    const prefix = platform.toUpperCase()
+    const missing = PLATFORM_REQUIREMENTS[platform].filter((suffix) => !readCredential(prefix, upper, suffix))
+    if (!r2Configured && PUBLIC_MEDIA_PLATFORMS.has(platform)) {
       missing.push('R2_CONFIG')
     }
+    if (missing.length === 0) {
+      available.push(platform)
+    }
 
     return {
       platform,
@@ -77,7 +84,7 @@ export function getSocialAuthReport(brand: string): SocialAuthReport {
 
   return {
     brand,
-    available: platforms.filter((platform) => platform.configured).map((platform) => platform.platform),
+    available,
     platforms,
     r2Configured,
   }
@@ -101,18 +108,7 @@ async function postToPlatform(platform: SocialPlatform, brand: string, text: str
     }
   }
 
-  switch (platform) {
-    case 'twitter':
-      return { platform, ...(await postToTwitter(brand, text, imagePath)) }
-    case 'linkedin':
-      return { platform, ...(await postToLinkedIn(brand, text, imagePath)) }
-    case 'facebook':
-      return { platform, ...(await postToFacebook(brand, text, imagePath)) }
-    case 'instagram':
-      return { platform, ...(await postToInstagram(brand, text, imagePath)) }
-    case 'threads':
-      return { platform, ...(await postToThreads(brand, text, imagePath, root)) }
-  }
+  return { platform, ...(await PLATFORM_POSTERS[platform](brand, text, imagePath, root)) }
 }
 
 export async function publishSocialPost(request: SocialPublishRequest): Promise<SocialPostResult[]> {
@@ -129,12 +125,12 @@ export async function publishSocialPost(request: SocialPublishRequest): Promise<
     }))
   }
 
-  const results: SocialPostResult[] = []
-  for (const platform of platforms) {
-    const imagePath = request.platformAssets[platform]
-    results.push(await postToPlatform(platform, request.brand, request.text, imagePath, request.root))
-  }
-  return results
+  // Platforms are independent, so post to all of them at once. Adapters
+  // report failures as results rather than throwing; results keep the
+  // requested platform order.
+  return await Promise.all(platforms.map((platform) =>
+    postToPlatform(platform, request.brand, request.text, request.platformAssets[platform], request.root),
+  ))
 }
 
 export function buildSocialPublishPlan(brand: string, options: PublishInput = {}): { platforms: SocialPlatform[]; auth: SocialAuthReport } {
@@ -142,7 +138,8 @@ export function buildSocialPublishPlan(brand: string, options: PublishInput = {}
   const platforms = selectPlatforms(auth, options)
 
   if (options.platforms && options.platforms.length > 0 && !options.dryRun) {
-    const unavailable = options.platforms.filter((platform) => !auth.available.includes(platform))
+    const available = new Set(auth.available)
+    const unavailable = options.platforms.filter((platform) => !available.has(platform))
     if (unavailable.length > 0) {
       throw new Error(`Requested platforms not configured for ${brand}: ${unavailable.join(', ')}. Run "loom ops auth check --brand ${brand}" first.`)
     }
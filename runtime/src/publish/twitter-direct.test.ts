@@ -0,0 +1,38 @@
+import { afterEach, describe, expect, test, vi } from 'vitest'
+import { postToTwitter } from './twitter-direct'
+
+const CREDENTIALS: Record<string, string> = {
+  TWITTER_GIVECARE_API_KEY: 'api-key',
+  TWITTER_GIVECARE_API_SECRET: 'api-secret',
+  TWITTER_GIVECARE_ACCESS_TOKEN: 'access-token',
+  TWITTER_GIVECARE_ACCESS_SECRET: 'access-secret',
+}
+
+function oauthNonce(init: RequestInit): string | undefined {
+  const authorization = (init.headers as Record<string, string>).Authorization
+  return /oauth_nonce="([^"]+)"/.exec(authorization)?.[1]
+}
+
+afterEach(() => {
+  vi.unstubAllGlobals()
+  for (const key of Object.keys(CREDENTIALS)) {
+    delete process.env[key]
+  }
+})
+
+describe('postToTwitter', () => {
+  test('signs every attempt with a fresh nonce', async () => {
+    Object.assign(process.env, CREDENTIALS)
+    const fetchMock = vi.fn()
+      .mockResolvedValueOnce(new Response('{}', { status: 429, headers: { 'retry-after': '0' } }))
+      .mockResolvedValueOnce(new Response(JSON.stringify({ data: { id: 'tweet-1' } }), { status: 201 }))
+    vi.stubGlobal('fetch', fetchMock)
+
+    await expect(postToTwitter('givecare', 'Care is infrastructure.')).resolves.toMatchObject({ success: true, postId: 'tweet-1' })
+
+    const nonces = fetchMock.mock.calls.map(([, init]) => oauthNonce(init as RequestInit))
+    expect(nonces).toHaveLength(2)
+    expect(nonces[0]).toBeDefined()
+    expect(nonces[0]).not.toBe(nonces[1])
+  })
+})
@@ -1,20 +1,27 @@
 import crypto from 'crypto'
-import { downloadImage } from '../core/http'
-import type { AdapterPostResult } from './base'
+import { downloadImage, fetchJson, imageFilename } from '../core/http'
+import { readCredential, type AdapterPostResult } from './base'
+import { recordRateLimitHeaders } from './rate-limit'
+
+const MEDIA_UPLOAD_URL = 'https://upload.twitter.com/1.1/media/upload.json'
+const TWEETS_URL = 'https://api.twitter.com/2/tweets'
+const STATUS_URL_PREFIX = 'https://x.com/i/status/'
 
 interface TwitterCredentials {
   apiKey: string
   apiSecret: string
   accessToken: string
   accessSecret: string
+  /** HMAC key derived from the two secrets; constant for the credentials' lifetime. */
+  signingKey: string
 }
 
 function getCredentials(brand: string): TwitterCredentials {
   const brandUpper = brand.toUpperCase()
-  const apiKey = process.env[`TWITTER_${brandUpper}_API_KEY`] ?? process.env.TWITTER_API_KEY
-  const apiSecret = process.env[`TWITTER_${brandUpper}_API_SECRET`] ?? process.env.TWITTER_API_SECRET
-  const accessToken = process.env[`TWITTER_${brandUpper}_ACCESS_TOKEN`]
-  const accessSecret = process.env[`TWITTER_${brandUpper}_ACCESS_SECRET`]
+  const apiKey = readCredential('TWITTER', brandUpper, 'API_KEY')
+  const apiSecret = readCredential('TWITTER', brandUpper, 'API_SECRET')
+  const accessToken = readCredential('TWITTER', brandUpper, 'ACCESS_TOKEN')
+  const accessSecret = readCredential('TWITTER', brandUpper, 'ACCESS_SECRET')
 
   if (!apiKey || !apiSecret) {
     throw new Error(`TWITTER_${brandUpper}_API_KEY/API_SECRET or shared TWITTER_API_KEY/TWITTER_API_SECRET required`)
@@ -23,7 +30,13 @@ function getCredentials(brand: string): TwitterCredentials {
     throw new Error(`TWITTER_${brandUpper}_ACCESS_TOKEN and TWITTER_${brandUpper}_ACCESS_SECRET required`)
   }
 
-  return { apiKey, apiSecret, accessToken, accessSecret }
+  return {
+    apiKey,
+    apiSecret,
+    accessToken,
+    accessSecret,
+    signingKey: `${encodeURIComponent(apiSecret)}&${encodeURIComponent(accessSecret)}`,
+  }
 }
 
 function generateOAuthSignature(
@@ -38,8 +51,7 @@ function generateOAuthSignature(
     .join('&')
 
   const base = [method.toUpperCase(), encodeURIComponent(url), encodeURIComponent(normalized)].join('&')
-  const signingKey = `${encodeURIComponent(credentials.apiSecret)}&${encodeURIComponent(credentials.accessSecret)}`
-  return crypto.createHmac('sha1', signingKey).update(base).digest('base64')
+  return crypto.createHmac('sha1', credentials.signingKey).update(base).digest('base64')
 }
 
 function generateOAuthHeader(
@@ -67,48 +79,40 @@ function generateOAuthHeader(
 
 async function uploadMedia(imagePath: string, credentials: TwitterCredentials): Promise<string> {
   const { data, mimeType } = await downloadImage(imagePath)
-  const url = 'https://upload.twitter.com/1.1/media/upload.json'
-  const form = new FormData()
-  const extension = mimeType.includes('png') ? 'png' : 'jpg'
-  form.append('media', new Blob([new Uint8Array(data)], { type: mimeType }), `image.${extension}`)
+  const media = new Blob([new Uint8Array(data)], { type: mimeType })
 
-  const response = await fetch(url, {
-    method: 'POST',
-    headers: {
-      Authorization: generateOAuthHeader('POST', url, credentials),
-    },
-    body: form,
+  // Each attempt is signed afresh: X rejects a resent nonce as a replay.
+  const payload = await fetchJson<{ media_id_string: string }>(MEDIA_UPLOAD_URL, 'Twitter media upload failed', () => {
+    const form = new FormData()
+    form.append('media', media, imageFilename(mimeType))
+    return {
+      method: 'POST',
+      headers: {
+        Authorization: generateOAuthHeader('POST', MEDIA_UPLOAD_URL, credentials),
+      },
+      body: form,
+    }
   })
-
-  if (!response.ok) {
-    throw new Error(`Twitter media upload failed: ${response.status} ${await response.text()}`)
-  }
-
-  const payload = await response.json() as { media_id_string: string }
   return payload.media_id_string
 }
 
-async function createTweet(text: string, mediaIds: string[], credentials: TwitterCredentials): Promise<string> {
-  const url = 'https://api.twitter.com/2/tweets'
+async function createTweet(brand: string, text: string, mediaIds: string[], credentials: TwitterCredentials): Promise<string> {
   const body: Record<string, unknown> = { text }
   if (mediaIds.length > 0) {
     body.media = { media_ids: mediaIds }
   }
 
-  const response = await fetch(url, {
+  const json = JSON.stringify(body)
+  const payload = await fetchJson<{ data: { id: string } }>(TWEETS_URL, 'Twitter tweet creation failed', () => ({
     method: 'POST',
     headers: {
-      Authorization: generateOAuthHeader('POST', url, credentials),
+      Authorization: generateOAuthHeader('POST', TWEETS_URL, credentials),
       'Content-Type': 'application/json',
     },
-    body: JSON.stringify(body),
+    body: json,
+  }), {
+    onHeaders: (headers) => recordRateLimitHeaders('twitter', brand, headers),
   })
-
-  if (!response.ok) {
-    throw new Error(`Twitter tweet creation failed: ${response.status} ${await response.text()}`)
-  }
-
-  const payload = await response.json() as { data: { id: string } }
   return payload.data.id
 }
 
@@ -116,12 +120,12 @@ export async function postToTwitter(brand: string, text: string, imagePath?: str
   try {
     const credentials = getCredentials(brand)
     const mediaIds = imagePath ? [await uploadMedia(imagePath, credentials)] : []
-    const id = await createTweet(text, mediaIds, credentials)
+    const id = await createTweet(brand, text, mediaIds, credentials)
 
     return {
       success: true,
       postId: id,
-      postUrl: `https://x.com/i/status/${id}`,
+      postUrl: `${STATUS_URL_PREFIX}${id}`,
     }
   } catch (error) {
     return {
@@ -13,11 +13,12 @@
  */
 
 import { createCanvas, Image, type CanvasRenderingContext2D } from 'canvas'
-import { writeFileSync, existsSync, readFileSync } from 'fs'
+import { writeFileSync, readFileSync } from 'fs'
 import { ensureParentDir } from '../core/paths'
 import { ditherCanvas, drawSubject, IMAGE_SUBJECTS, type ImageSubject } from './dither'
 import { muted } from './colors'
 import { ensureFontsRegistered } from './fonts'
+import { wrapText } from './text'
 
 ensureFontsRegistered()
 
@@ -87,9 +88,14 @@ const TYPE: Record<string, { family: string; weight: number; style?: string }> =
   brand:    { family: '"JetBrains Mono", monospace', weight: 500 },
 }
 
+// Style + weight half of each role's CSS font shorthand, fixed at load so
+// font() only splices in the size.
+const FONT_PREFIX: Record<string, string> = Object.fromEntries(
+  Object.entries(TYPE).map(([role, t]) => [role, t.style ? `${t.style} ${t.weight}` : String(t.weight)]),
+)
+
 function font(role: string, sizePx: number): string {
-  const t = TYPE[role]
-  return `${t.style || ''} ${t.weight} ${sizePx}px ${t.family}`.trimStart()
+  return `${FONT_PREFIX[role]} ${sizePx}px ${TYPE[role].family}`
 }
 
 // ── Scale + primitives ──
@@ -118,23 +124,6 @@ function drawSpaced(ctx: CanvasRenderingContext2D, text: string, x: number, y: n
   }
 }
 
-function wrapText(ctx: CanvasRenderingContext2D, text: string, maxWidth: number): string[] {
-  const words = text.split(/\s+/).filter(Boolean)
-  const lines: string[] = []
-  let current = ''
-  for (const word of words) {
-    const test = current ? current + ' ' + word : word
-    if (ctx.measureText(test).width > maxWidth && current) {
-      lines.push(current)
-      current = word
-    } else {
-      current = test
-    }
-  }
-  if (current) lines.push(current)
-  return lines
-}
-
 // ── Main render ──
 
 export function renderCard(input: CardInput, platform: PlatformSpec, seed: string): Buffer {
@@ -310,10 +299,16 @@ export function renderCard(input: CardInput, platform: PlatformSpec, seed: strin
   // Positioned at bottom margin, adapts opacity to ground contrast
   const markY = height - Math.round(mBottom * 0.4)
   const logoOpacity = g.dark ? 0.35 : 0.5
-  if (input.logoPath && existsSync(input.logoPath)) {
+  let logoBytes: Buffer | undefined
+  if (input.logoPath) {
+    try {
+      logoBytes = readFileSync(input.logoPath)
+    } catch { /* missing logo: fall back to the wordmark */ }
+  }
+  if (logoBytes) {
     try {
       const img = new Image()
-      img.src = readFileSync(input.logoPath)
+      img.src = logoBytes
       const logoH = sz(1) * 1.2
       const logoW = (img.width / img.height) * logoH
       ctx.globalAlpha = logoOpacity
@@ -78,7 +78,17 @@ const DRAW: Record<ImageSubject, DrawFn> = {
   },
 }
 
-const BAYER = [0, 8, 2, 10, 12, 4, 14, 6, 3, 11, 1, 9, 15, 7, 13, 5].map(v => v / 16)
+// 4x4 Bayer matrix pre-scaled to 0-255 gray thresholds.
+const BAYER_THRESHOLDS = Float64Array.from([0, 8, 2, 10, 12, 4, 14, 6, 3, 11, 1, 9, 15, 7, 13, 5], v => (v / 16) * 255)
+const INK_ALPHA = 140
+const LITTLE_ENDIAN = new Uint8Array(new Uint32Array([1]).buffer)[0] === 1
+
+/** Pack one RGBA pixel into the word layout of a Uint32Array view over ImageData. */
+function rgbaWord(r: number, g: number, b: number, a: number): number {
+  return LITTLE_ENDIAN
+    ? ((a << 24) | (b << 16) | (g << 8) | r) >>> 0
+    : ((r << 24) | (g << 16) | (b << 8) | a) >>> 0
+}
 
 export function ditherCanvas(
   sourceCtx: CanvasRenderingContext2D,
@@ -87,16 +97,19 @@ export function ditherCanvas(
 ): void {
   const imageData = sourceCtx.getImageData(0, 0, w, h)
   const data = imageData.data
-  for (let y = 0; y < h; y++) for (let x = 0; x < w; x++) {
-    const i = (y * w + x) * 4
-    const gray = data[i] * 0.299 + data[i + 1] * 0.587 + data[i + 2] * 0.114
-    const bit = gray < BAYER[(y % 4) * 4 + (x % 4)] * 255 ? 0 : 255
-    if (dark) {
-      data[i] = 255; data[i + 1] = 255; data[i + 2] = 255
-    } else {
-      data[i] = 0; data[i + 1] = 0; data[i + 2] = 0
+  // Read gray from the bytes, then write each pixel as a single 32-bit word.
+  const pixels = new Uint32Array(data.buffer, data.byteOffset, data.length >> 2)
+  const ink = dark ? 255 : 0
+  const inkWord = rgbaWord(ink, ink, ink, INK_ALPHA)
+  const clearWord = rgbaWord(ink, ink, ink, 0)
+  let p = 0
+  for (let y = 0; y < h; y++) {
+    const row = (y & 3) << 2
+    for (let x = 0; x < w; x++, p++) {
+      const i = p << 2
+      const gray = data[i] * 0.299 + data[i + 1] * 0.587 + data[i + 2] * 0.114
+      pixels[p] = gray < BAYER_THRESHOLDS[row | (x & 3)] ? inkWord : clearWord
     }
-    data[i + 3] = bit === 0 ? 140 : 0
   }
   sourceCtx.putImageData(imageData, 0, 0)
 }
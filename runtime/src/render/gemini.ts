@@ -1,11 +1,42 @@
 /** Shared Gemini generation. Text + image, used by all pipelines. */
 
-export async function generateText(prompt: string): Promise<string | null> {
+import type { GoogleGenAI } from '@google/genai'
+
+const SUBJECT_PLACEHOLDER = /\[SUBJECT\]/i
+const imagePromptParts = new Map<string, string[]>()
+
+/**
+ * Substitute `[SUBJECT]` in a brand image prompt. The template is split
+ * once per distinct prompt and later calls only join the cached pieces.
+ */
+export function fillImagePrompt(template: string, subject: string): string {
+  let parts = imagePromptParts.get(template)
+  if (!parts) {
+    parts = template.split(SUBJECT_PLACEHOLDER)
+    imagePromptParts.set(template, parts)
+  }
+  return parts.join(subject)
+}
+
+const clients = new Map<string, GoogleGenAI>()
+
+// One client per API key for the process, so text and image calls share it.
+async function getClient(): Promise<GoogleGenAI | null> {
   const key = process.env.GEMINI_API_KEY || process.env.GOOGLE_API_KEY
   if (!key) return null
 
+  const cached = clients.get(key)
+  if (cached) return cached
+
   const { GoogleGenAI } = await import('@google/genai')
   const client = new GoogleGenAI({ apiKey: key })
+  clients.set(key, client)
+  return client
+}
+
+export async function generateText(prompt: string): Promise<string | null> {
+  const client = await getClient()
+  if (!client) return null
 
   const response = await client.models.generateContent({
     model: 'gemini-2.5-flash',
@@ -16,11 +47,8 @@ export async function generateText(prompt: string): Promise<string | null> {
 }
 
 export async function generateImage(prompt: string): Promise<Buffer | null> {
-  const key = process.env.GEMINI_API_KEY || process.env.GOOGLE_API_KEY
-  if (!key) return null
-
-  const { GoogleGenAI } = await import('@google/genai')
-  const client = new GoogleGenAI({ apiKey: key })
+  const client = await getClient()
+  if (!client) return null
 
   const response = await client.models.generateContent({
     model: 'gemini-3.1-flash-image-preview',
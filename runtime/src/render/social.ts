@@ -8,13 +8,14 @@
  * Falls back to solid-color canvas when no API key is set.
  */
 
-import { existsSync, readFileSync, writeFileSync } from 'fs'
+import { readFile, writeFile } from 'fs/promises'
 import { join } from 'path'
-import { createCanvas, Image, type CanvasRenderingContext2D } from 'canvas'
+import { createCanvas, Image } from 'canvas'
 import type { BrandFoundation, SocialPlatform } from '../domain/types'
 import { ensureParentDir, type RuntimePaths } from '../core/paths'
 import { ensureFontsRegistered } from './fonts'
-import { generateImage } from './gemini'
+import { fillImagePrompt, generateImage } from './gemini'
+import { wrapText } from './text'
 
 ensureFontsRegistered()
 
@@ -47,26 +48,6 @@ const PLATFORM_SPECS: PlatformSpec[] = [
   { platform: 'twitter',   width: 1600, height: 900,  aspect: '16:9', layout: 'wide' },
 ]
 
-// ── Helpers ──
-
-
-function wrapText(ctx: CanvasRenderingContext2D, text: string, maxWidth: number): string[] {
-  const words = text.split(/\s+/).filter(Boolean)
-  const lines: string[] = []
-  let current = ''
-  for (const word of words) {
-    const candidate = current ? `${current} ${word}` : word
-    if (ctx.measureText(candidate).width <= maxWidth) {
-      current = candidate
-    } else {
-      if (current) lines.push(current)
-      current = word
-    }
-  }
-  if (current) lines.push(current)
-  return lines
-}
-
 // ── Phase 1: Gemini generates art-only image ──
 
 function buildArtPrompt(
@@ -76,7 +57,7 @@ function buildArtPrompt(
 ): string {
   // Prefer the brand's curated image_prompt over generic composition tokens
   if (brand.visual.imagePrompt) {
-    const base = brand.visual.imagePrompt.replace(/\[SUBJECT\]/gi, headline)
+    const base = fillImagePrompt(brand.visual.imagePrompt, headline)
     // Override aspect ratio to match platform
     return base
       .replace(/1:1 square/gi, `${spec.aspect} at ${spec.width}x${spec.height}`)
@@ -102,7 +83,7 @@ function compositeAsset(
   spec: PlatformSpec,
   brand: BrandFoundation,
   headline: string,
-): Buffer {
+): Promise<Buffer> {
   const { width, height } = spec
   const canvas = createCanvas(width, height)
   const ctx = canvas.getContext('2d')
@@ -138,7 +119,10 @@ function compositeAsset(
     ctx.fillText(lines[i], margin, cursorY + i * lineH)
   }
 
-  return canvas.toBuffer('image/png')
+  // The callback form encodes on the libuv threadpool instead of blocking the event loop.
+  return new Promise((resolve, reject) => {
+    canvas.toBuffer((error, png) => (error ? reject(error) : resolve(png)), 'image/png')
+  })
 }
 
 // ── Public API ──
@@ -147,6 +131,20 @@ function outputPath(paths: RuntimePaths, runId: string, platform: SocialPlatform
   return join(paths.artifactsDir, runId, `${platform}.png`)
 }
 
+/** Read the source image off the event loop; a missing file means no art. */
+async function loadSourceImage(path: string): Promise<Image | undefined> {
+  let bytes: Buffer
+  try {
+    bytes = await readFile(path)
+  } catch (error) {
+    if ((error as NodeJS.ErrnoException).code === 'ENOENT') return undefined
+    throw error
+  }
+  const image = new Image()
+  image.src = bytes
+  return image
+}
+
 export async function renderSocialAssets(options: RenderSocialAssetsOptions): Promise<Record<SocialPlatform, string>> {
   const hasApiKey = !!(process.env.GEMINI_API_KEY || process.env.GOOGLE_API_KEY)
 
@@ -164,20 +162,23 @@ export async function renderSocialAssets(options: RenderSocialAssetsOptions): Pr
       artImage.src = artBytes
     }
   }
-  if (!artImage && options.sourceImagePath && existsSync(options.sourceImagePath)) {
-    artImage = new Image()
-    artImage.src = readFileSync(options.sourceImagePath)
+  if (!artImage && options.sourceImagePath) {
+    artImage = await loadSourceImage(options.sourceImagePath)
   }
 
-  const assets = {} as Record<SocialPlatform, string>
-
-  for (const spec of PLATFORM_SPECS) {
-    const png = compositeAsset(artImage, spec, options.brand, options.headline)
+  // Drawing is synchronous, but PNG encoding and file writes for every
+  // platform overlap; the threadpool size bounds how many encode at once.
+  const rendered = await Promise.all(PLATFORM_SPECS.map(async (spec) => {
+    const png = await compositeAsset(artImage, spec, options.brand, options.headline)
     const path = outputPath(options.paths, options.runId, spec.platform)
     ensureParentDir(path)
-    writeFileSync(path, png)
-    assets[spec.platform] = path
-  }
+    await writeFile(path, png)
+    return path
+  }))
 
+  const assets = {} as Record<SocialPlatform, string>
+  PLATFORM_SPECS.forEach((spec, index) => {
+    assets[spec.platform] = rendered[index] as string
+  })
   return assets
 }
@@ -0,0 +1,32 @@
+/** Shared text layout for all renderers. */
+
+import type { CanvasRenderingContext2D } from 'canvas'
+
+/**
+ * Greedy word wrap. Each word is measured once and lines are packed by
+ * summed widths, instead of re-measuring the growing line for every word.
+ * A word wider than maxWidth gets a line of its own.
+ */
+export function wrapText(ctx: CanvasRenderingContext2D, text: string, maxWidth: number): string[] {
+  const words = text.split(/\s+/).filter(Boolean)
+  const spaceWidth = ctx.measureText(' ').width
+  const lines: string[] = []
+  let line: string[] = []
+  let lineWidth = 0
+
+  for (const word of words) {
+    const wordWidth = ctx.measureText(word).width
+    const nextWidth = line.length > 0 ? lineWidth + spaceWidth + wordWidth : wordWidth
+    if (line.length > 0 && nextWidth > maxWidth) {
+      lines.push(line.join(' '))
+      line = [word]
+      lineWidth = wordWidth
+    } else {
+      line.push(word)
+      lineWidth = nextWidth
+    }
+  }
+
+  if (line.length > 0) lines.push(line.join(' '))
+  return lines
+}
@@ -9,11 +9,35 @@ function ensureColumn(db: DatabaseSync, table: string, column: string, definitio
   }
 }
 
+// One connection per database file, shared by every Runtime in the process.
+const openDatabases = new Map<string, DatabaseSync>()
+
+/** Close every cached connection, e.g. before a test removes its runtime root. */
+export function closeRuntimeDbs(): void {
+  for (const db of openDatabases.values()) {
+    db.close()
+  }
+  openDatabases.clear()
+}
+
 export function openRuntimeDb(root?: string): DatabaseSync {
   const paths = resolveRuntimePaths(root)
+  const cached = openDatabases.get(paths.dbPath)
+  if (cached) {
+    return cached
+  }
+
   ensureRuntimePaths(paths)
   const db = new DatabaseSync(paths.dbPath)
 
+  // WAL lets each commit append to the log instead of rewriting pages through
+  // a rollback journal, and NORMAL syncs at checkpoints rather than on every
+  // commit; a crash can lose only the last commits, never corrupt the file.
+  db.exec(`
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = NORMAL;
+  `)
+
   db.exec(`
     CREATE TABLE IF NOT EXISTS runs (
       id TEXT PRIMARY KEY,
@@ -41,6 +65,7 @@ export function openRuntimeDb(root?: string): DatabaseSync {
 
   ensureColumn(db, 'runs', 'error_message', 'TEXT')
 
+  openDatabases.set(paths.dbPath, db)
   return db
 }
 
@@ -1,9 +1,9 @@
-import { existsSync, mkdtempSync, mkdirSync, writeFileSync, rmSync } from 'fs'
+import { existsSync, mkdtempSync, mkdirSync, readdirSync, writeFileSync, rmSync } from 'fs'
 import { tmpdir } from 'os'
-import { join } from 'path'
+import { basename, dirname, join } from 'path'
 import { afterAll, afterEach, describe, expect, test } from 'vitest'
 import { createRuntime } from './runtime'
-import { openRuntimeDb } from './db'
+import { closeRuntimeDbs, openRuntimeDb } from './db'
 import { getSocialAuthReport, type SocialPublishRequest } from '../publish/social'
 
 const roots: string[] = []
@@ -96,6 +96,7 @@ for (const key of IMAGE_API_KEYS) {
 }
 
 afterEach(() => {
+  closeRuntimeDbs()
   while (roots.length > 0) {
     rmSync(roots.pop()!, { recursive: true, force: true })
   }
@@ -238,6 +239,33 @@ describe('runtime workflows', () => {
     )
   })
 
+  test('rolls back a failed step and removes the artifact files it wrote', async () => {
+    const root = createWorkspace()
+    const runtime = createRuntime({ root })
+    suppressImageApiKeys()
+
+    // Fail the outline insert after its artifact file has been written.
+    const db = openRuntimeDb(root)
+    db.exec(`
+      CREATE TRIGGER fail_outline BEFORE INSERT ON artifacts WHEN NEW.type = 'outline'
+      BEGIN SELECT RAISE(ABORT, 'outline insert failed'); END
+    `)
+
+    await expect(runtime.runWorkflow({
+      workflow: 'blog.post',
+      brand: 'givecare',
+      input: { topic: 'why caregiver benefits fail' },
+    })).rejects.toThrow('outline insert failed')
+
+    const run = db.prepare(`SELECT * FROM runs ORDER BY created_at DESC LIMIT 1`).get() as Record<string, unknown>
+    expect(run.status).toBe('failed')
+    expect(run.current_step).toBe('outline')
+
+    const rows = db.prepare(`SELECT type, path FROM artifacts WHERE run_id = ? ORDER BY created_at ASC`).all(String(run.id)) as Array<{ type: string; path: string }>
+    expect(rows.map((row) => row.type)).toEqual(['signal_packet', 'brief'])
+    expect(readdirSync(dirname(rows[0].path)).sort()).toEqual(rows.map((row) => basename(row.path)).sort())
+  })
+
   test('does not allow reviewing a published run again', async () => {
     const root = createWorkspace()
     setEnv('TWITTER_GIVECARE_API_KEY', 'api-key')
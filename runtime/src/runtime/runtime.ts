@@ -1,14 +1,14 @@
-import { readFileSync, writeFileSync } from 'fs'
+import { rmSync } from 'fs'
 import { join } from 'path'
-import type { DatabaseSync } from 'node:sqlite'
+import type { DatabaseSync, StatementSync } from 'node:sqlite'
 import { loadBrandFoundation } from '../brands/load'
 import { loadRuntimeEnv } from '../core/env'
-import { ensureParentDir, ensureRuntimePaths, resolveRuntimePaths, type RuntimePaths } from '../core/paths'
+import { ensureRuntimePaths, resolveRuntimePaths, writeFileAtomic, type RuntimePaths } from '../core/paths'
 import { createId, nowIso } from '../core/ids'
 import { buildSocialPublishPlan, publishSocialPost, type SocialPublisher } from '../publish/social'
 import {
   WORKFLOWS,
-  cloneArtifactData,
+  draftVariants,
   findArtifact,
   formatSocialPostText,
   resolveFormat,
@@ -42,6 +42,9 @@ export class Runtime {
   private readonly root?: string
   private readonly db: DatabaseSync
   private readonly paths: RuntimePaths
+  private readonly statements = new Map<string, StatementSync>()
+  // Artifact files written inside the open transaction, removed if it rolls back.
+  private transactionFiles: string[] | null = null
   private socialPublisher: SocialPublisher
 
   constructor(options: RuntimeOptions = {}) {
@@ -104,21 +107,16 @@ export class Runtime {
     const limit = Math.max(1, Math.min(options.limit ?? 25, 500))
     const offset = Math.max(0, options.offset ?? 0)
     if (options.full) {
-      const rows = this.db.prepare(
+      const rows = this.statement(
         `SELECT * FROM runs WHERE status = 'in_review' ORDER BY created_at DESC LIMIT ? OFFSET ?`,
       ).all(limit, offset) as Array<Record<string, unknown>>
       return rows.map((row) => this.rowToRun(row))
     }
-    const rows = this.db.prepare(
-      `SELECT id, status, workflow, brand, created_at FROM runs WHERE status = 'in_review' ORDER BY created_at DESC LIMIT ? OFFSET ?`,
-    ).all(limit, offset) as Array<Record<string, unknown>>
-    return rows.map((row) => ({
-      id: String(row.id),
-      status: row.status as RunRecord['status'],
-      workflow: row.workflow as RunRecord['workflow'],
-      brand: String(row.brand),
-      createdAt: String(row.created_at),
-    }))
+    // Columns are aliased to RunSummary's field names and are all TEXT, so
+    // rows come back in their final shape with no per-row remapping.
+    return this.statement(
+      `SELECT id, status, workflow, brand, created_at AS createdAt FROM runs WHERE status = 'in_review' ORDER BY created_at DESC LIMIT ? OFFSET ?`,
+    ).all(limit, offset) as RunSummary[]
   }
 
   reviewRun(runId: string, input: ReviewInput): RunRecord {
@@ -133,9 +131,8 @@ export class Runtime {
     const status: RunStatus = input.decision === 'approve' ? 'approved' : 'rejected'
 
     if (input.selectedVariantId) {
-      const artifacts = this.listArtifacts(runId)
-      const draft = findArtifact(artifacts, 'draft_set')
-      const variants = Array.isArray(draft?.data.variants) ? draft.data.variants as Array<Record<string, unknown>> : []
+      const draft = this.findRunArtifact(runId, 'draft_set')
+      const variants = draftVariants(draft)
       const hasSelectedVariant = variants.some((variant) => variant.id === input.selectedVariantId)
       if (!hasSelectedVariant) {
         throw new Error(`Variant not found for run ${runId}: ${input.selectedVariantId}`)
@@ -148,8 +145,7 @@ export class Runtime {
       selectedVariantId: input.selectedVariantId ?? null,
     })
 
-    this.updateRun(runId, status, 'review')
-    return this.getRun(runId)
+    return this.updateRun(runId, status, 'review')
   }
 
   setSocialPublisher(publisher: SocialPublisher): void {
@@ -177,7 +173,7 @@ export class Runtime {
       const draft = findArtifact(artifacts, 'draft_set')
       const assetSet = findArtifact(artifacts, 'asset_set')
       const approval = findArtifact([...artifacts].reverse(), 'approval')
-      const variants = Array.isArray(draft?.data.variants) ? draft.data.variants as Array<Record<string, unknown>> : []
+      const variants = draftVariants(draft)
       const selectedVariantId = typeof approval?.data.selectedVariantId === 'string'
         ? approval.data.selectedVariantId
         : undefined
@@ -199,9 +195,10 @@ export class Runtime {
       }
 
       const plan = buildSocialPublishPlan(run.brand, input)
+      const text = formatSocialPostText(selectedVariant)
       const results = await this.socialPublisher({
         brand: run.brand,
-        text: formatSocialPostText(selectedVariant),
+        text,
         platformAssets,
         platforms: plan.platforms,
         dryRun: input.dryRun,
@@ -212,7 +209,7 @@ export class Runtime {
       payload.platforms = plan.platforms
       payload.results = results
       payload.selectedVariantId = selectedVariant.id ?? null
-      payload.text = formatSocialPostText(selectedVariant)
+      payload.text = text
       payload.imagePath = typeof assetSet?.data.imagePath === 'string' ? assetSet.data.imagePath : null
       payload.platformAssets = platformAssets
       payload.auth = plan.auth
@@ -222,21 +219,18 @@ export class Runtime {
       this.writeArtifact(runId, 'delivery', 'publish', payload)
       const status: RunStatus = input.dryRun ? 'approved' : allSucceeded ? 'published' : 'approved'
       const step: StepName = input.dryRun ? 'review' : allSucceeded ? 'publish' : 'review'
-      this.updateRun(runId, status, step)
-      return this.getRun(runId)
+      return this.updateRun(runId, status, step)
     }
 
     if (run.workflow === 'blog.post') {
       const article = findArtifact(artifacts, 'article_draft')
       const exportPath = join(this.paths.exportsDir, `${runId}.md`)
-      ensureParentDir(exportPath)
-      writeFileSync(exportPath, String(article?.data.markdown ?? ''), 'utf8')
+      writeFileAtomic(exportPath, String(article?.data.markdown ?? ''))
       payload.exportPath = exportPath
     }
 
     this.writeArtifact(runId, 'delivery', 'publish', payload)
-    this.updateRun(runId, 'published', 'publish')
-    return this.getRun(runId)
+    return this.updateRun(runId, 'published', 'publish')
   }
 
   async retryRun(runId: string, input: RetryInput): Promise<RunRecord> {
@@ -265,31 +259,25 @@ export class Runtime {
 
     this.insertRun(newRun)
 
-    const originalArtifacts = this.listArtifacts(runId)
-
-    const reused = originalArtifacts
-      .filter((artifact) => {
-        const stepIndex = steps.findIndex((step) => step.name === artifact.step)
-        return stepIndex > -1 && stepIndex < startIndex
-      })
-      .map((artifact) => ({
-        type: artifact.type,
-        step: artifact.step,
-        data: cloneArtifactData(artifact.data),
-      }))
-
-    const priorArtifacts = reused.map((artifact) =>
-      this.writeArtifact(newRun.id, artifact.type, artifact.step, artifact.data),
-    )
+    // listArtifacts parses rows into fresh objects, so their data can be
+    // written to the new run without a defensive deep copy.
+    const reusedSteps = new Set(steps.slice(0, startIndex).map((step) => step.name))
+    const priorArtifacts = this.transaction(() => this.listArtifacts(runId)
+      .filter((artifact) => reusedSteps.has(artifact.step))
+      .map((artifact) => this.writeArtifact(newRun.id, artifact.type, artifact.step, artifact.data)))
     await this.executeWorkflow(newRun, brand, priorArtifacts, startIndex)
     return this.getRun(newRun.id)
   }
 
   health(): Record<string, unknown> {
-    const counts = this.db.prepare(`SELECT status, COUNT(*) as count FROM runs GROUP BY status`).all() as Array<Record<string, unknown>>
-    const byStatus = Object.fromEntries(
-      counts.map((row) => [String(row.status), Number(row.count)]),
-    ) as Partial<Record<RunStatus, number>>
+    const counts = this.statement(`SELECT status, COUNT(*) as count FROM runs GROUP BY status`).all() as Array<Record<string, unknown>>
+    const byStatus: Partial<Record<RunStatus, number>> = {}
+    let totalRuns = 0
+    for (const row of counts) {
+      const count = Number(row.count)
+      byStatus[row.status as RunStatus] = count
+      totalRuns += count
+    }
 
     return {
       root: this.paths.root,
@@ -298,7 +286,7 @@ export class Runtime {
       stateDir: this.paths.stateDir,
       reviewRuns: byStatus.in_review ?? 0,
       failedRuns: byStatus.failed ?? 0,
-      totalRuns: Object.values(byStatus).reduce((sum, count) => sum + (count ?? 0), 0),
+      totalRuns,
     }
   }
 
@@ -308,7 +296,9 @@ export class Runtime {
     seedArtifacts: ArtifactRecord[],
     startIndex: number,
   ): Promise<void> {
-    let priorArtifacts = [...seedArtifacts]
+    // Copied once, then extended in place: each step sees the artifacts
+    // written so far without re-spreading the whole list per step.
+    const priorArtifacts = [...seedArtifacts]
     const steps = WORKFLOWS[run.workflow]
 
     for (const step of steps.slice(startIndex)) {
@@ -322,12 +312,15 @@ export class Runtime {
           paths: this.paths,
         })
 
-        const writtenArtifacts = outputs.map((output) =>
-          this.writeArtifact(run.id, output.type, step.name, output.data),
-        )
+        const writtenArtifacts = this.transaction(() => {
+          const written = outputs.map((output) =>
+            this.writeArtifact(run.id, output.type, step.name, output.data),
+          )
+          this.updateRun(run.id, 'in_review', step.name)
+          return written
+        })
 
-        priorArtifacts = [...priorArtifacts, ...writtenArtifacts]
-        this.updateRun(run.id, 'in_review', step.name)
+        priorArtifacts.push(...writtenArtifacts)
       } catch (error) {
         this.updateRunFailure(run.id, step.name, error)
         throw error
@@ -335,8 +328,42 @@ export class Runtime {
     }
   }
 
+  /** Prepare each distinct SQL string once per Runtime and reuse the compiled statement. */
+  private statement(sql: string): StatementSync {
+    let statement = this.statements.get(sql)
+    if (!statement) {
+      statement = this.db.prepare(sql)
+      this.statements.set(sql, statement)
+    }
+    return statement
+  }
+
+  /**
+   * Group a step's writes into one SQLite commit instead of one per statement.
+   * SQLite cannot roll back the artifact files, so a rollback deletes the ones
+   * written inside the transaction.
+   */
+  private transaction<T>(fn: () => T): T {
+    const files: string[] = []
+    this.db.exec('BEGIN')
+    this.transactionFiles = files
+    try {
+      const result = fn()
+      this.db.exec('COMMIT')
+      return result
+    } catch (error) {
+      this.db.exec('ROLLBACK')
+      for (const path of files) {
+        rmSync(path, { force: true })
+      }
+      throw error
+    } finally {
+      this.transactionFiles = null
+    }
+  }
+
   private insertRun(run: RunRecord): void {
-    this.db.prepare(`
+    this.statement(`
       INSERT INTO runs (id, workflow, brand, status, input_json, current_step, created_at, updated_at, parent_run_id, error_message)
       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
     `).run(
@@ -353,17 +380,23 @@ export class Runtime {
     )
   }
 
-  private updateRun(runId: string, status: RunStatus, currentStep: StepName): void {
-    this.db.prepare(`
+  /** Update a run and return the stored row, so callers need no follow-up read. */
+  private updateRun(runId: string, status: RunStatus, currentStep: StepName): RunRecord {
+    const row = this.statement(`
       UPDATE runs
       SET status = ?, current_step = ?, updated_at = ?, error_message = NULL
       WHERE id = ?
-    `).run(status, currentStep, nowIso(), runId)
+      RETURNING *
+    `).get(status, currentStep, nowIso(), runId) as Record<string, unknown> | undefined
+    if (!row) {
+      throw new Error(`Run not found: ${runId}`)
+    }
+    return this.rowToRun(row)
   }
 
   private updateRunFailure(runId: string, currentStep: StepName, error: unknown): void {
     const message = error instanceof Error ? error.message : String(error)
-    this.db.prepare(`
+    this.statement(`
       UPDATE runs
       SET status = 'failed', current_step = ?, updated_at = ?, error_message = ?
       WHERE id = ?
@@ -375,12 +408,14 @@ export class Runtime {
     const path = join(this.paths.artifactsDir, runId, `${artifactId}.json`)
     const createdAt = nowIso()
 
-    ensureParentDir(path)
-    writeFileSync(path, JSON.stringify(data, null, 2), 'utf8')
-    this.db.prepare(`
+    // Serialize once: the same document backs the artifact file and the row.
+    const json = JSON.stringify(data, null, 2)
+    writeFileAtomic(path, json)
+    this.transactionFiles?.push(path)
+    this.statement(`
       INSERT INTO artifacts (id, run_id, type, step, path, created_at, data_json)
       VALUES (?, ?, ?, ?, ?, ?, ?)
-    `).run(artifactId, runId, type, step, path, createdAt, JSON.stringify(data))
+    `).run(artifactId, runId, type, step, path, createdAt, json)
 
     return {
       id: artifactId,
@@ -394,13 +429,29 @@ export class Runtime {
   }
 
   private listArtifacts(runId: string): ArtifactRecord[] {
-    const rows = this.db.prepare(`
+    const rows = this.statement(`
       SELECT * FROM artifacts
       WHERE run_id = ?
       ORDER BY created_at ASC
     `).all(runId) as Array<Record<string, unknown>>
 
-    return rows.map((row) => ({
+    return rows.map((row) => this.rowToArtifact(row))
+  }
+
+  /** First artifact of one type, filtered in SQL so other rows are never parsed. */
+  private findRunArtifact(runId: string, type: ArtifactType): ArtifactRecord | undefined {
+    const row = this.statement(`
+      SELECT * FROM artifacts
+      WHERE run_id = ? AND type = ?
+      ORDER BY created_at ASC
+      LIMIT 1
+    `).get(runId, type) as Record<string, unknown> | undefined
+
+    return row ? this.rowToArtifact(row) : undefined
+  }
+
+  private rowToArtifact(row: Record<string, unknown>): ArtifactRecord {
+    return {
       id: String(row.id),
       runId: String(row.run_id),
       type: row.type as ArtifactType,
@@ -408,11 +459,11 @@ export class Runtime {
       path: String(row.path),
       createdAt: String(row.created_at),
       data: JSON.parse(String(row.data_json)) as Record<string, unknown>,
-    }))
+    }
   }
 
   private getRun(runId: string): RunRecord {
-    const row = this.db.prepare(`SELECT * FROM runs WHERE id = ?`).get(runId) as Record<string, unknown> | undefined
+    const row = this.statement(`SELECT * FROM runs WHERE id = ?`).get(runId) as Record<string, unknown> | undefined
     if (!row) {
       throw new Error(`Run not found: ${runId}`)
     }
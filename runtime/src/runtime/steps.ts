@@ -92,16 +92,18 @@ export function findArtifact(artifacts: ArtifactRecord[], type: ArtifactType): A
   return artifacts.find((artifact) => artifact.type === type)
 }
 
+/** Variants of a draft_set artifact, read once; empty when absent or malformed. */
+export function draftVariants(draft: ArtifactRecord | undefined): Array<Record<string, unknown>> {
+  const variants = draft?.data.variants
+  return Array.isArray(variants) ? variants as Array<Record<string, unknown>> : []
+}
+
 export function formatSocialPostText(variant: Record<string, unknown>): string {
   return [variant.hook, variant.body, variant.cta]
     .filter((value) => typeof value === 'string' && value.trim().length > 0)
     .join('\n\n')
 }
 
-export function cloneArtifactData(data: Record<string, unknown>): Record<string, unknown> {
-  return JSON.parse(JSON.stringify(data)) as Record<string, unknown>
-}
-
 // --- Step implementations ---
 
 async function discoverTopic(brand: BrandFoundation): Promise<string | null> {
@@ -249,7 +251,7 @@ async function buildImageArtifacts(context: WorkflowContext): Promise<StepOutput
 async function buildAssetArtifacts(context: WorkflowContext): Promise<StepOutput[]> {
   const draft = findArtifact(context.priorArtifacts, 'draft_set')
   const sourceImage = findArtifact(context.priorArtifacts, 'source_image')
-  const mainVariant = Array.isArray(draft?.data.variants) ? draft?.data.variants[0] as Record<string, unknown> : null
+  const mainVariant: Record<string, unknown> | undefined = draftVariants(draft)[0]
   const headline = typeof draft?.data.headline === 'string'
     ? draft.data.headline
     : String(mainVariant?.hook ?? context.input.topic ?? 'Untitled')